@@ -4,37 +4,155 @@ Project Structure Validation Script
 Validates that files are in correct directories according to .cursorrules
 """
 
+import fnmatch
+import functools
 import os
 import sys
 from pathlib import Path
 
-def check_root_pollution():
-    """Check for files that shouldn't be in root directory"""
-    print("🔍 Checking for root directory pollution...")
+try:
+    # Linear-time DFA matching when Google's RE2 bindings are installed
+    import re2 as _re
+except ImportError:
+    import re as _re
+
+# Files that should NOT be in root
+FORBIDDEN_PATTERNS = [
+    "*.debug", "debug_*", "*.log", "*.trace", "*.dump",
+    "*.test", "test_*", "*_test", "*.spec",
+    "*.tmp", "*.temp", "temp_*", "*.cache", "cache_*",
+    "*.bak", "*.backup", "backup_*", "*.old",
+    ".DS_Store", "Thumbs.db", "._*", ".Spotlight-V100", ".Trashes",
+    "ehthumbs.db", "*.swp", "*.swo", "*~"
+]
+
+def _glob_to_regex(pattern):
+    """Translate a glob to a regex without the end anchor that RE2 does not accept"""
+    regex = fnmatch.translate(pattern)
+    for anchor in ("\\Z", "\\z"):
+        if regex.endswith(anchor):
+            return regex[:-len(anchor)]
+    return regex
+
+# All forbidden patterns compiled into one anchored alternation, matched once per file
+_FORBIDDEN_RE = _re.compile("^(?:" + "|".join(_glob_to_regex(p) for p in FORBIDDEN_PATTERNS) + ")$")
+
+# Entry scripts allowed in root even though they look like debug files
+ROOT_ENTRY_SCRIPTS = frozenset([
+    "debug-helper.sh", "cleanup.sh", "dev-workflow.sh", "activate.sh", "install.sh"
+])
+
+# Directories that must exist (trailing slash: must be a directory)
+REQUIRED_DIRS = (
+    "docs/",
+    "docs/js/",
+    "docs/css/",
+    "docs/assets/",
+    "docs/data/",
+    "ai_training/",
+    "ai_training/models/",
+    "ai_training/scripts/",
+    "ai_training/data/",
+    ".venv/",
+    "temp/",
+    "DEBUG/"
+)
+
+# Entry scripts whose length is reported
+ENTRY_SCRIPTS = (
+    "install.sh",
+    "activate.sh",
+    "cleanup.sh",
+    "verify-phase1.py"
+)
+
+def _count_ext(root, ext):
+    """Count files below root ending with ext using a single scandir pass per directory"""
+    count = 0
+    stack = [root]
+    
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(ext):
+                        count += 1
+        except OSError:
+            continue
+    
+    return count
+
+def _count_lines(path):
+    """Count lines like str.split('\\n') would, without decoding the file"""
+    newlines = 0
     
-    # Files that should NOT be in root
-    forbidden_patterns = [
-        "*.debug", "debug_*", "*.log", "*.trace", "*.dump",
-        "*.test", "test_*", "*_test", "*.spec",
-        "*.tmp", "*.temp", "temp_*", "*.cache", "cache_*",
-        "*.bak", "*.backup", "backup_*", "*.old",
-        ".DS_Store", "Thumbs.db", "._*", ".Spotlight-V100", ".Trashes",
-        "ehthumbs.db", "*.swp", "*.swo", "*~"
-    ]
+    with open(path, 'rb') as f:
+        while chunk := f.read(1 << 16):
+            newlines += chunk.count(b'\n')
+    
+    return newlines + 1
+
+@functools.lru_cache(maxsize=None)
+def _list_dir(directory):
+    """Map entry names in directory to whether they are directories, from one scandir call"""
+    # Children of a missing directory are answered from the parent's listing,
+    # so a missing top-level directory costs one lookup for its whole subtree
+    if directory != ".":
+        parent, name = os.path.split(directory)
+        if not _list_dir(parent or ".").get(name):
+            return {}
+    
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except OSError:
+        return {}
+
+def _path_exists(path):
+    """os.path.exists answered from the cached listing of the parent directory"""
+    parent, name = os.path.split(path.rstrip("/"))
+    is_dir = _list_dir(parent or ".").get(name)
     
+    # A trailing slash only matches directories, as with os.path.exists
+    if path.endswith("/"):
+        return bool(is_dir)
+    return is_dir is not None
+
+@functools.lru_cache(maxsize=None)
+def _scan_root_once():
+    """Classify root files as pollution, test and debug files in a single scandir pass"""
     violations = []
+    test_files = []
+    debug_files = []
     
-    for file in os.listdir("."):
-        if os.path.isfile(file):
-            for pattern in forbidden_patterns:
-                if pattern.startswith("*"):
-                    if file.endswith(pattern[1:]):
-                        violations.append(f"File '{file}' matches forbidden pattern '{pattern}'")
-                elif pattern.endswith("*"):
-                    if file.startswith(pattern[:-1]):
-                        violations.append(f"File '{file}' matches forbidden pattern '{pattern}'")
-                elif file == pattern:
-                    violations.append(f"File '{file}' matches forbidden pattern '{pattern}'")
+    with os.scandir(".") as entries:
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            
+            name = entry.name
+            lower = name.lower()
+            
+            if _FORBIDDEN_RE.match(name):
+                pattern = next(p for p in FORBIDDEN_PATTERNS if fnmatch.fnmatchcase(name, p))
+                violations.append(f"File '{name}' matches forbidden pattern '{pattern}'")
+            
+            if "test" in lower or name.endswith(".test"):
+                test_files.append(name)
+            
+            if ("debug" in lower or name.endswith(".debug")) and name not in ROOT_ENTRY_SCRIPTS:
+                debug_files.append(name)
+    
+    return violations, test_files, debug_files
+
+def check_root_pollution():
+    """Check for files that shouldn't be in root directory"""
+    print("🔍 Checking for root directory pollution...")
+    
+    violations, _, _ = _scan_root_once()
     
     if violations:
         print("❌ Root directory pollution found:")
@@ -49,25 +167,10 @@ def check_directory_structure():
     """Check that required directories exist"""
     print("\n📁 Checking directory structure...")
     
-    required_dirs = [
-        "docs/",
-        "docs/js/",
-        "docs/css/",
-        "docs/assets/",
-        "docs/data/",
-        "ai_training/",
-        "ai_training/models/",
-        "ai_training/scripts/",
-        "ai_training/data/",
-        ".venv/",
-        "temp/",
-        "DEBUG/"
-    ]
-    
     missing_dirs = []
     
-    for dir_path in required_dirs:
-        if not os.path.exists(dir_path):
+    for dir_path in REQUIRED_DIRS:
+        if not _path_exists(dir_path):
             missing_dirs.append(dir_path)
     
     if missing_dirs:
@@ -83,12 +186,9 @@ def check_file_organization():
     """Check that files are in correct directories"""
     print("\n📄 Checking file organization...")
     
-    # Check that test files are in temp/tests/
-    test_files_in_root = []
-    for file in os.listdir("."):
-        if os.path.isfile(file) and ("test" in file.lower() or file.endswith(".test")):
-            test_files_in_root.append(file)
+    _, test_files_in_root, debug_files_in_root = _scan_root_once()
     
+    # Check that test files are in temp/tests/
     if test_files_in_root:
         print("❌ Test files found in root directory:")
         for file in test_files_in_root:
@@ -98,15 +198,6 @@ def check_file_organization():
         print("✅ No test files in root directory")
     
     # Check that debug files are in DEBUG/ (excluding entry scripts)
-    debug_files_in_root = []
-    entry_scripts = ["debug-helper.sh", "cleanup.sh", "dev-workflow.sh", "activate.sh", "install.sh"]
-    
-    for file in os.listdir("."):
-        if os.path.isfile(file) and ("debug" in file.lower() or file.endswith(".debug")):
-            # Skip entry scripts
-            if file not in entry_scripts:
-                debug_files_in_root.append(file)
-    
     if debug_files_in_root:
         print("❌ Debug files found in root directory:")
         for file in debug_files_in_root:
@@ -121,25 +212,16 @@ def check_entry_scripts():
     """Check that entry scripts are lean"""
     print("\n📝 Checking entry scripts...")
     
-    entry_scripts = [
-        "install.sh",
-        "activate.sh",
-        "cleanup.sh",
-        "verify-phase1.py"
-    ]
-    
-    for script in entry_scripts:
-        if os.path.exists(script):
-            with open(script, 'r') as f:
-                content = f.read()
-                lines = content.split('\n')
-                
-                # Check if script is too long (more than 200 lines)
-                if len(lines) > 200:
-                    print(f"⚠️  Entry script '{script}' is quite long ({len(lines)} lines)")
-                    print(f"   Consider breaking it into smaller modules")
-                else:
-                    print(f"✅ Entry script '{script}' is appropriately sized ({len(lines)} lines)")
+    for script in ENTRY_SCRIPTS:
+        if _path_exists(script):
+            line_count = _count_lines(script)
+            
+            # Check if script is too long (more than 200 lines)
+            if line_count > 200:
+                print(f"⚠️  Entry script '{script}' is quite long ({line_count} lines)")
+                print(f"   Consider breaking it into smaller modules")
+            else:
+                print(f"✅ Entry script '{script}' is appropriately sized ({line_count} lines)")
     
     return True
 
@@ -148,50 +230,43 @@ def check_modular_design():
     print("\n🏗️ Checking modular design...")
     
     # Check that JavaScript files are properly organized
-    js_files = []
-    for root, dirs, files in os.walk("docs/js"):
-        for file in files:
-            if file.endswith(".js"):
-                js_files.append(os.path.join(root, file))
-    
-    if len(js_files) > 0:
-        print(f"✅ JavaScript files are organized in modules ({len(js_files)} files)")
+    js_count = _count_ext("docs/js", ".js")
+    
+    if js_count > 0:
+        print(f"✅ JavaScript files are organized in modules ({js_count} files)")
     else:
         print("❌ No JavaScript files found in docs/js/")
         return False
     
     # Check that Python files are properly organized
-    py_files = []
-    for root, dirs, files in os.walk("ai_training"):
-        for file in files:
-            if file.endswith(".py"):
-                py_files.append(os.path.join(root, file))
-    
-    if len(py_files) > 0:
-        print(f"✅ Python files are organized in modules ({len(py_files)} files)")
+    py_count = _count_ext("ai_training", ".py")
+    
+    if py_count > 0:
+        print(f"✅ Python files are organized in modules ({py_count} files)")
     else:
         print("❌ No Python files found in ai_training/")
         return False
     
     return True
 
+# Validation checks run by main(), in order
+CHECKS = (
+    check_root_pollution,
+    check_directory_structure,
+    check_file_organization,
+    check_entry_scripts,
+    check_modular_design
+)
+
 def main():
     """Run all validation checks"""
     print("🎮 Rock Paper Scissors Battle Royale - Structure Validation")
     print("=" * 60)
     
-    checks = [
-        check_root_pollution,
-        check_directory_structure,
-        check_file_organization,
-        check_entry_scripts,
-        check_modular_design
-    ]
-    
     passed = 0
-    total = len(checks)
+    total = len(CHECKS)
     
-    for check in checks:
+    for check in CHECKS:
         if check():
             passed += 1
         print()
@@ -202,11 +277,11 @@ def main():
     if passed == total:
         print("🎉 Project structure is valid and follows .cursorrules!")
         print("✅ Ready for development and collaboration")
-        return 0
     else:
         print("❌ Project structure needs attention")
         print("🔧 Run './cleanup.sh' to fix issues")
-        return 1
+    
+    return int(passed != total)
 
 if __name__ == "__main__":
     sys.exit(main())
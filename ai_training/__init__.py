@@ -10,13 +10,15 @@ __version__ = "1.0.0"
 __author__ = "Your Name"
 __email__ = "your.email@example.com"
 
-# Import main components
-from .models.genetic_algorithm import GeneticAlgorithm
-from .models.neural_network import NeuralNetwork
-from .models.reinforcement_learning import ReinforcementLearning
-
+# Main components, imported lazily through ai_training.models
 __all__ = [
     "GeneticAlgorithm",
     "NeuralNetwork", 
     "ReinforcementLearning",
 ]
+
+def __getattr__(name):
+    if name in __all__:
+        from . import models
+        return getattr(models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
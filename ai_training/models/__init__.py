@@ -7,12 +7,23 @@ This module contains various AI models for strategy evolution:
 - Reinforcement Learning: Q-learning and policy gradient methods
 """
 
-from .genetic_algorithm import GeneticAlgorithm
-from .neural_network import NeuralNetwork
-from .reinforcement_learning import ReinforcementLearning
+import importlib
+
+# Models are imported on first access (PEP 562), so using one model does not
+# load the numerical backends of the others
+_MODEL_MODULES = {
+    "GeneticAlgorithm": ".genetic_algorithm",
+    "NeuralNetwork": ".neural_network",
+    "ReinforcementLearning": ".reinforcement_learning",
+}
 
 __all__ = [
     "GeneticAlgorithm",
     "NeuralNetwork",
     "ReinforcementLearning",
 ]
+
+def __getattr__(name):
+    if name in _MODEL_MODULES:
+        return getattr(importlib.import_module(_MODEL_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
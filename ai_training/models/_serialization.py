@@ -0,0 +1,31 @@
+"""
+File helpers shared by the models' save and load methods
+"""
+
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dump_json(path: str, data) -> None:
+    """
+    Write data to path as compact JSON
+    
+    NumPy arrays are serialized directly by orjson when it is installed and
+    converted with tolist() otherwise. orjson writes NaN as null.
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'), default=lambda a: a.tolist())
+
+
+def _npz_path(path: str) -> str:
+    """Path NumPy writes a compressed archive to, adding ``.npz`` when missing"""
+    return path if path.endswith('.npz') else path + '.npz'
@@ -5,43 +5,191 @@ This module implements a genetic algorithm to evolve optimal strategies
 for the Rock Paper Scissors Battle Royale game.
 """
 
-import random
+import multiprocessing
+import os
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 import numpy as np
-from typing import List, Tuple, Dict, Any
-from dataclasses import dataclass
+from typing import List, Tuple, Dict, Any, Callable, Optional
 import json
 import logging
+import math
+
+from ._serialization import _dump_json, _npz_path
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Gene layout shared by every row of the population array
+GENE_NAMES = ('aggression', 'patience', 'grouping', 'speed', 'vision', 'avoidance')
+N_GENES = len(GENE_NAMES)
+
+# Column layout of batched simulation results, with defaults for missing keys
+RESULT_NAMES = ('survival_time', 'conversions', 'damage_dealt', 'damage_taken')
+RESULT_DEFAULTS = (0.0, 0.0, 0.0, 1.0)
+
+
+def _build_bonus_lut() -> np.ndarray:
+    """
+    Strategy-specific fitness bonus for every combination of bonus flags
+
+    Bits 0-2 flag high aggression, patience and grouping genes, bits 3-5 flag
+    the matching results (many conversions, long survival, little damage);
+    each bonus applies when both its gene and result bit are set.
+    """
+    bits = (np.arange(64)[:, None] >> np.arange(6)) & 1
+    return (2.0 * (bits[:, 0] & bits[:, 3])
+            + 1.5 * (bits[:, 1] & bits[:, 4])
+            + 1.0 * (bits[:, 2] & bits[:, 5]))
+
+
+BONUS_LUT = _build_bonus_lut()
+
+# Ranges used when sampling fresh strategies
+INIT_LOW = np.array([0.0, 0.0, 0.0, 0.5, 50.0, 0.0], dtype=np.float32)
+INIT_HIGH = np.array([1.0, 1.0, 1.0, 2.0, 150.0, 1.0], dtype=np.float32)
+
+# Hard bounds enforced after mutation
+GENE_LOW = np.array([0.0, 0.0, 0.0, 0.1, 10.0, 0.0], dtype=np.float32)
+GENE_HIGH = np.array([1.0, 1.0, 1.0, 3.0, 200.0, 1.0], dtype=np.float32)
+
+# Standard deviation of the gaussian mutation noise per gene
+MUTATION_SIGMA = np.array([0.1, 0.1, 0.1, 0.2, 10.0, 0.1], dtype=np.float32)
+
+
+# The kernels take their random draws from the caller, since numba's prange
+# threads keep their own generator state that np.random.seed does not reach
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mutate_inplace(genes, noise, mutated, lo, hi):
+        """Add clipped noise to the mutated rows in one pass"""
+        for i in prange(genes.shape[0]):
+            if mutated[i]:
+                for j in range(genes.shape[1]):
+                    value = genes[i, j] + noise[i, j]
+                    genes[i, j] = min(max(value, lo[j]), hi[j])
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _uniform_crossover(parent1, parent2, swap1, swap2, child1, child2):
+        """Uniform crossover of paired parent rows into preallocated children"""
+        for i in prange(parent1.shape[0]):
+            for j in range(parent1.shape[1]):
+                child1[i, j] = parent2[i, j] if swap1[i, j] else parent1[i, j]
+                child2[i, j] = parent1[i, j] if swap2[i, j] else parent2[i, j]
+
+
+def _gene_property(index: int) -> property:
+    """Expose one column of the gene row as a float attribute"""
+    def getter(self) -> float:
+        return float(self.genes[index])
+
+    def setter(self, value: float) -> None:
+        self.genes[index] = value
+
+    return property(getter, setter, doc=f"{GENE_NAMES[index]} gene")
+
+
 class Strategy:
-    """Represents a strategy with genetic parameters"""
-    aggression: float
-    patience: float
-    grouping: float
-    speed: float
-    vision: float
-    avoidance: float
-    fitness: float = 0.0
-    generation: int = 0
-    
+    """
+    Represents a strategy with genetic parameters
+
+    A strategy is a thin view onto one row of the population arrays owned by
+    a GeneticAlgorithm, so reading or writing its attributes goes straight to
+    the shared NumPy storage (float32 genes). Strategies created directly own
+    their storage and keep their genes in float64.
+    A fitness of NaN marks a strategy that has not been evaluated yet.
+    """
+
+    __slots__ = ('genes', '_fitness', '_generation')
+
+    aggression = _gene_property(0)
+    patience = _gene_property(1)
+    grouping = _gene_property(2)
+    speed = _gene_property(3)
+    vision = _gene_property(4)
+    avoidance = _gene_property(5)
+
+    def __init__(self,
+                 aggression: float,
+                 patience: float,
+                 grouping: float,
+                 speed: float,
+                 vision: float,
+                 avoidance: float,
+                 fitness: float = math.nan,
+                 generation: int = 0):
+        self.genes = np.array([aggression, patience, grouping, speed, vision, avoidance],
+                              dtype=np.float64)
+        self._fitness = np.array([fitness], dtype=np.float64)
+        self._generation = np.array([generation], dtype=np.int32)
+
+    @classmethod
+    def view(cls, genes: np.ndarray, fitness: np.ndarray,
+             generations: np.ndarray, index: int) -> 'Strategy':
+        """Create a strategy backed by row ``index`` of population arrays"""
+        strategy = cls.__new__(cls)
+        strategy.genes = genes[index]
+        strategy._fitness = fitness[index:index + 1]
+        strategy._generation = generations[index:index + 1]
+        return strategy
+
+    @property
+    def fitness(self) -> float:
+        return float(self._fitness[0])
+
+    @fitness.setter
+    def fitness(self, value: float) -> None:
+        self._fitness[0] = value
+
+    @property
+    def generation(self) -> int:
+        return int(self._generation[0])
+
+    @generation.setter
+    def generation(self, value: int) -> None:
+        self._generation[0] = value
+
+    def copy(self) -> 'Strategy':
+        """Create a strategy that owns a copy of this strategy's data"""
+        strategy = Strategy.__new__(Strategy)
+        strategy.genes = self.genes.copy()
+        strategy._fitness = self._fitness.copy()
+        strategy._generation = self._generation.copy()
+        return strategy
+
+    def __repr__(self) -> str:
+        params = ', '.join(f"{name}={value!r}" for name, value in self.to_dict().items())
+        return f"Strategy({params})"
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert strategy to dictionary"""
-        return {
-            'aggression': self.aggression,
-            'patience': self.patience,
-            'grouping': self.grouping,
-            'speed': self.speed,
-            'vision': self.vision,
-            'avoidance': self.avoidance,
-            'fitness': self.fitness,
-            'generation': self.generation
-        }
+        if self.genes.dtype == np.float32:
+            # Shortest decimal that round-trips the float32 value, so a gene
+            # of 0.1 is written as 0.1 rather than 0.10000000149011612
+            genes = [float(str(value)) for value in self.genes]
+        else:
+            genes = self.genes.tolist()
+        data = dict(zip(GENE_NAMES, genes))
+        data['fitness'] = self.fitness
+        data['generation'] = self.generation
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Strategy':
         """Create strategy from dictionary"""
+        # Unevaluated fitness is NaN, which orjson writes as null; files saved
+        # before NaN was used marked it 0.0, so that also loads as unevaluated
+        # (a strategy that truly scored 0.0 is just simulated again)
+        fitness = data.get('fitness')
+        if fitness is None or fitness == 0.0:
+            fitness = math.nan
+        
         return cls(
             aggression=data['aggression'],
             patience=data['patience'],
@@ -49,13 +197,17 @@ class Strategy:
             speed=data['speed'],
             vision=data['vision'],
             avoidance=data['avoidance'],
-            fitness=data.get('fitness', 0.0),
+            fitness=fitness,
             generation=data.get('generation', 0)
         )
 
 class GeneticAlgorithm:
     """
     Genetic Algorithm for evolving Rock Paper Scissors strategies
+
+    The population is stored as a structure of arrays: ``genes`` holds one
+    row of gene values per strategy, with ``fitness`` and ``birth_generation``
+    aligned to it, so genetic operators work on whole arrays at once.
     """
     
     def __init__(self, 
@@ -63,7 +215,12 @@ class GeneticAlgorithm:
                  mutation_rate: float = 0.1,
                  crossover_rate: float = 0.8,
                  elite_size: int = 5,
-                 max_generations: int = 100):
+                 max_generations: int = 100,
+                 n_workers: Optional[int] = 1,
+                 use_threads: bool = False,
+                 cache_size: int = 10_000,
+                 fitness_samples: int = 1,
+                 seed: Optional[int] = None):
         """
         Initialize the genetic algorithm
         
@@ -73,36 +230,86 @@ class GeneticAlgorithm:
             crossover_rate: Probability of crossover
             elite_size: Number of best strategies to preserve
             max_generations: Maximum number of generations to evolve
+            n_workers: Number of workers used to run per-strategy simulations
+                in parallel (None uses every CPU, 1 runs serially)
+            use_threads: Use threads instead of processes for the workers,
+                for simulators that release the GIL
+            cache_size: Maximum number of fitness values remembered per
+                (rounded) gene vector, 0 disables the cache
+            fitness_samples: Number of simulations averaged per strategy,
+                useful to stabilise cached values of stochastic simulators
+            seed: Seed for the random generator, for reproducible runs
         """
         self.population_size = population_size
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.elite_size = elite_size
         self.max_generations = max_generations
-        
-        self.population: List[Strategy] = []
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.use_threads = use_threads
+        self.cache_size = cache_size
+        self.fitness_samples = max(fitness_samples, 1)
+        self._fitness_cache: 'OrderedDict[tuple, float]' = OrderedDict()
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        
+        self.init_lo = INIT_LOW.copy()
+        self.init_hi = INIT_HIGH.copy()
+        self.lo = GENE_LOW.copy()
+        self.hi = GENE_HIGH.copy()
+        self.sigma = MUTATION_SIGMA.copy()
+        
+        self.genes = np.empty((0, N_GENES), dtype=np.float32)
+        self.fitness = np.empty(0, dtype=np.float64)
+        self.birth_generation = np.empty(0, dtype=np.int32)
+        self._spare = (self.genes, self.fitness, self.birth_generation)
         self.generation = 0
         self.best_fitness_history: List[float] = []
         self.average_fitness_history: List[float] = []
+        # Best fitness of the last 11 generations, for the convergence check
+        self._recent_best: deque = deque(maxlen=11)
         
         logger.info(f"Genetic Algorithm initialized with population size {population_size}")
     
+    @property
+    def population(self) -> List[Strategy]:
+        """
+        Strategies of the current population as views onto the gene array
+        
+        The views are only valid for the current generation, since the
+        storage is reused when the population evolves.
+        """
+        return [self.get_strategy(i) for i in range(len(self.genes))]
+    
+    @population.setter
+    def population(self, strategies: List[Strategy]) -> None:
+        self.genes = np.array([s.genes for s in strategies], dtype=np.float32).reshape(-1, N_GENES)
+        self.fitness = np.array([s.fitness for s in strategies], dtype=np.float64)
+        self.birth_generation = np.array([s.generation for s in strategies], dtype=np.int32)
+    
+    def get_strategy(self, index: int) -> Strategy:
+        """Get a view of the strategy stored at ``index``"""
+        return Strategy.view(self.genes, self.fitness, self.birth_generation, index)
+    
+    def best_index(self) -> int:
+        """Index of the fittest evaluated strategy (0 if none is evaluated)"""
+        return int(np.argmax(np.where(np.isnan(self.fitness), -np.inf, self.fitness)))
+    
+    def random_genes(self, n: int) -> np.ndarray:
+        """Sample gene rows for ``n`` random strategies"""
+        span = self.init_hi - self.init_lo
+        return self.init_lo + span * self.rng.random((n, N_GENES), dtype=np.float32)
+    
     def create_random_strategy(self) -> Strategy:
         """Create a random strategy"""
-        return Strategy(
-            aggression=random.uniform(0.0, 1.0),
-            patience=random.uniform(0.0, 1.0),
-            grouping=random.uniform(0.0, 1.0),
-            speed=random.uniform(0.5, 2.0),
-            vision=random.uniform(50.0, 150.0),
-            avoidance=random.uniform(0.0, 1.0),
-            generation=self.generation
-        )
+        return Strategy(*self.random_genes(1)[0].tolist(), generation=self.generation)
     
     def initialize_population(self) -> None:
         """Initialize the population with random strategies"""
-        self.population = [self.create_random_strategy() for _ in range(self.population_size)]
-        logger.info(f"Initialized population with {len(self.population)} strategies")
+        self.genes = self.random_genes(self.population_size)
+        self.fitness = np.full(self.population_size, np.nan)
+        self.birth_generation = np.full(self.population_size, self.generation, dtype=np.int32)
+        logger.info(f"Initialized population with {len(self.genes)} strategies")
     
     def evaluate_fitness(self, strategy: Strategy, simulation_results: Dict[str, Any]) -> float:
         """
@@ -146,161 +353,344 @@ class GeneticAlgorithm:
         
         return max(0.0, fitness)
     
-    def select_parents(self) -> List[Strategy]:
-        """Select parents for reproduction using tournament selection"""
-        parents = []
-        
-        for _ in range(self.population_size - self.elite_size):
-            # Tournament selection
-            tournament_size = 3
-            tournament = random.sample(self.population, tournament_size)
-            winner = max(tournament, key=lambda s: s.fitness)
-            parents.append(winner)
-        
-        return parents
+    def evaluate_fitness_batch(self, genes: np.ndarray, results: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the fitness of many strategies at once
+        
+        Args:
+            genes: Gene rows of the strategies to evaluate (n, N_GENES)
+            results: Simulation results, one row per strategy with columns
+                ordered as RESULT_NAMES (n, len(RESULT_NAMES))
+            
+        Returns:
+            Fitness scores (higher is better)
+        """
+        survival_time, conversions, damage_dealt, damage_taken = results.T
+        
+        # Survival time, conversions and damage ratio factors
+        fitness = (survival_time * 0.3
+                   + conversions * 10.0
+                   + damage_dealt / np.maximum(damage_taken, 1) * 5.0)
+        
+        # Strategy-specific bonuses, packed into one flag byte per strategy
+        conditions = np.column_stack((
+            genes[:, 0] > 0.7, genes[:, 1] > 0.7, genes[:, 2] > 0.6,
+            conversions > 5, survival_time > 100, damage_taken < 50
+        ))
+        flags = np.packbits(conditions, axis=1, bitorder='little')[:, 0]
+        fitness += BONUS_LUT[flags]
+        
+        return np.maximum(fitness, 0.0)
     
-    def crossover(self, parent1: Strategy, parent2: Strategy) -> Tuple[Strategy, Strategy]:
+    def simulate_each(self, simulation_function: Callable[[Strategy], Dict[str, Any]],
+                      genes: np.ndarray, executor: Optional[Executor] = None) -> np.ndarray:
         """
-        Create two offspring from two parents using uniform crossover
+        Run a per-strategy simulation function over a batch of gene rows
         
         Args:
-            parent1: First parent strategy
-            parent2: Second parent strategy
+            simulation_function: Function that simulates one strategy and
+                returns a results dictionary
+            genes: Gene rows to simulate (n, N_GENES)
+            executor: Optional executor used to run the simulations in parallel;
+                simulation_function must be picklable for process pools
             
         Returns:
-            Tuple of two offspring strategies
+            Simulation results with columns ordered as RESULT_NAMES
         """
-        if random.random() > self.crossover_rate:
-            return parent1, parent2
-        
-        # Create offspring
-        child1 = Strategy(
-            aggression=random.choice([parent1.aggression, parent2.aggression]),
-            patience=random.choice([parent1.patience, parent2.patience]),
-            grouping=random.choice([parent1.grouping, parent2.grouping]),
-            speed=random.choice([parent1.speed, parent2.speed]),
-            vision=random.choice([parent1.vision, parent2.vision]),
-            avoidance=random.choice([parent1.avoidance, parent2.avoidance]),
-            generation=self.generation + 1
-        )
+        strategies = [Strategy(*row.tolist(), generation=self.generation) for row in genes]
         
-        child2 = Strategy(
-            aggression=random.choice([parent1.aggression, parent2.aggression]),
-            patience=random.choice([parent1.patience, parent2.patience]),
-            grouping=random.choice([parent1.grouping, parent2.grouping]),
-            speed=random.choice([parent1.speed, parent2.speed]),
-            vision=random.choice([parent1.vision, parent2.vision]),
-            avoidance=random.choice([parent1.avoidance, parent2.avoidance]),
-            generation=self.generation + 1
-        )
+        if executor is None:
+            outcomes = map(simulation_function, strategies)
+        else:
+            chunksize = max(1, len(strategies) // (4 * self.n_workers))
+            outcomes = executor.map(simulation_function, strategies, chunksize=chunksize)
+        
+        results = np.empty((len(genes), len(RESULT_NAMES)))
+        
+        for i, outcome in enumerate(outcomes):
+            results[i] = [outcome.get(name, default)
+                          for name, default in zip(RESULT_NAMES, RESULT_DEFAULTS)]
         
-        return child1, child2
+        return results
     
-    def mutate(self, strategy: Strategy) -> Strategy:
+    def _simulate_fitness(self, genes: np.ndarray,
+                          batch_simulation_function: Callable) -> np.ndarray:
+        """Simulate gene rows and average their fitness over fitness_samples runs"""
+        fitness = np.zeros(len(genes))
+        
+        for _ in range(self.fitness_samples):
+            results = np.asarray(batch_simulation_function(genes), dtype=np.float64)
+            fitness += self.evaluate_fitness_batch(genes, results)
+        
+        return fitness / self.fitness_samples
+    
+    def _cached_fitness(self, genes: np.ndarray,
+                        batch_simulation_function: Callable) -> np.ndarray:
+        """Look up the fitness of gene rows in the cache, simulating only misses"""
+        if self.cache_size <= 0:
+            return self._simulate_fitness(genes, batch_simulation_function)
+        
+        keys = [tuple(row) for row in np.round(genes, 3).tolist()]
+        fitness = np.empty(len(genes))
+        misses = []
+        
+        for i, key in enumerate(keys):
+            cached = self._fitness_cache.get(key)
+            if cached is None:
+                misses.append(i)
+            else:
+                self._fitness_cache.move_to_end(key)
+                fitness[i] = cached
+        
+        if misses:
+            fitness[misses] = self._simulate_fitness(genes[misses], batch_simulation_function)
+            for i in misses:
+                self._fitness_cache[keys[i]] = float(fitness[i])
+            while len(self._fitness_cache) > self.cache_size:
+                self._fitness_cache.popitem(last=False)
+        
+        logger.debug(f"Fitness cache: {len(genes) - len(misses)}/{len(genes)} hits")
+        
+        return fitness
+    
+    def select_parents(self) -> np.ndarray:
+        """
+        Select parents for reproduction using tournament selection
+        
+        Returns:
+            Population indices of the selected parents
         """
-        Mutate a strategy by randomly changing some parameters
+        n_parents = max(self.population_size - self.elite_size, 0)
+        tournament_size = 3
+        
+        # One row of candidates per tournament, the fittest candidate wins
+        candidates = self.rng.integers(0, len(self.fitness), size=(n_parents, tournament_size))
+        winners = np.argmax(self.fitness[candidates], axis=1)
+        
+        return candidates[np.arange(n_parents), winners]
+    
+    def crossover(self, parent1: np.ndarray, parent2: np.ndarray,
+                  child1: Optional[np.ndarray] = None,
+                  child2: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Create offspring from paired parents using uniform crossover
         
         Args:
-            strategy: Strategy to mutate
+            parent1: Genes of the first parent of each pair (n_pairs, N_GENES)
+            parent2: Genes of the second parent of each pair (n_pairs, N_GENES)
+            child1: Optional preallocated output for the first offspring
+            child2: Optional preallocated output for the second offspring
             
         Returns:
-            Mutated strategy
+            Tuple of both offspring gene arrays and a mask of the pairs that
+            were crossed over (the others are copies of their parents)
         """
-        if random.random() > self.mutation_rate:
-            return strategy
-        
-        # Create mutated copy
-        mutated = Strategy(
-            aggression=max(0.0, min(1.0, strategy.aggression + random.gauss(0, 0.1))),
-            patience=max(0.0, min(1.0, strategy.patience + random.gauss(0, 0.1))),
-            grouping=max(0.0, min(1.0, strategy.grouping + random.gauss(0, 0.1))),
-            speed=max(0.1, min(3.0, strategy.speed + random.gauss(0, 0.2))),
-            vision=max(10.0, min(200.0, strategy.vision + random.gauss(0, 10))),
-            avoidance=max(0.0, min(1.0, strategy.avoidance + random.gauss(0, 0.1))),
-            generation=strategy.generation
-        )
+        child1 = np.empty_like(parent1) if child1 is None else child1
+        child2 = np.empty_like(parent2) if child2 is None else child2
+        
+        crossed = self.rng.random(len(parent1)) < self.crossover_rate
+        
+        # Each child picks every gene from either parent with equal chance
+        swap1 = self.rng.integers(0, 2, size=parent1.shape, dtype=np.int8).astype(bool) & crossed[:, None]
+        swap2 = self.rng.integers(0, 2, size=parent1.shape, dtype=np.int8).astype(bool) & crossed[:, None]
+        
+        if NUMBA_AVAILABLE:
+            _uniform_crossover(parent1, parent2, swap1, swap2, child1, child2)
+            return child1, child2, crossed
+        
+        np.copyto(child1, parent1)
+        np.copyto(child1, parent2, where=swap1)
+        np.copyto(child2, parent2)
+        np.copyto(child2, parent1, where=swap2)
+        
+        return child1, child2, crossed
+    
+    def mutate(self, genes: np.ndarray) -> np.ndarray:
+        """
+        Mutate strategies in place by adding gaussian noise to their genes
+        
+        Args:
+            genes: Gene rows to mutate (n, N_GENES)
+            
+        Returns:
+            Mask of the rows that were mutated
+        """
+        mutated = self.rng.random(len(genes)) < self.mutation_rate
+        noise = self.rng.standard_normal(genes.shape, dtype=np.float32) * self.sigma
+        
+        if NUMBA_AVAILABLE:
+            _mutate_inplace(genes, noise, mutated, self.lo, self.hi)
+            return mutated
+        
+        np.clip(genes + mutated[:, None] * noise, self.lo, self.hi, out=genes)
         
         return mutated
     
+    def _spare_buffers(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Population arrays for the next generation, reusing the previous generation's storage"""
+        genes, fitness, birth_generation = self._spare
+        
+        if len(genes) != self.population_size:
+            genes = np.empty((self.population_size, N_GENES), dtype=np.float32)
+            fitness = np.empty(self.population_size)
+            birth_generation = np.empty(self.population_size, dtype=np.int32)
+        
+        return genes, fitness, birth_generation
+    
     def evolve_generation(self) -> None:
         """Evolve one generation of strategies"""
-        # Sort population by fitness
-        self.population.sort(key=lambda s: s.fitness, reverse=True)
-        
         # Keep elite strategies
-        elite = self.population[:self.elite_size]
+        n_elite = min(self.elite_size, len(self.fitness), self.population_size)
+        elite = np.argpartition(-self.fitness, n_elite - 1)[:n_elite] if n_elite else []
         
-        # Select parents
+        # Select parents and pair them up
         parents = self.select_parents()
-        
-        # Create new generation
-        new_population = elite.copy()
-        
-        for i in range(0, len(parents), 2):
-            if i + 1 < len(parents):
-                parent1, parent2 = parents[i], parents[i + 1]
-                child1, child2 = self.crossover(parent1, parent2)
-                
-                # Mutate children
-                child1 = self.mutate(child1)
-                child2 = self.mutate(child2)
-                
-                new_population.extend([child1, child2])
+        n_pairs = len(parents) // 2
+        parent1, parent2 = parents[0:2 * n_pairs:2], parents[1:2 * n_pairs:2]
+        
+        # The next generation is written into the previous generation's arrays:
+        # elites, then children interleaved as (child1, child2) per pair, then random fill
+        genes, fitness, birth_generation = self._spare_buffers()
+        children = slice(n_elite, n_elite + 2 * n_pairs)
+        fill = slice(children.stop, self.population_size)
+        
+        genes[:n_elite] = self.genes[elite]
+        fitness[:n_elite] = self.fitness[elite]
+        birth_generation[:n_elite] = self.birth_generation[elite]
+        
+        # Create and mutate children in place
+        _, _, crossed = self.crossover(self.genes[parent1], self.genes[parent2],
+                                       genes[children][0::2], genes[children][1::2])
+        mutated = self.mutate(genes[children])
+        
+        # Untouched copies keep their parent's fitness, everything else is re-evaluated
+        child_parents = np.stack((parent1, parent2), axis=1).ravel()
+        crossed = np.repeat(crossed, 2)
+        fitness[children] = np.where(crossed | mutated, np.nan, self.fitness[child_parents])
+        birth_generation[children] = np.where(crossed, self.generation + 1,
+                                              self.birth_generation[child_parents])
         
         # Ensure population size
-        while len(new_population) < self.population_size:
-            new_population.append(self.create_random_strategy())
+        genes[fill] = self.random_genes(fill.stop - fill.start)
+        fitness[fill] = np.nan
+        birth_generation[fill] = self.generation
         
-        self.population = new_population[:self.population_size]
+        self._spare = (self.genes, self.fitness, self.birth_generation)
+        self.genes, self.fitness, self.birth_generation = genes, fitness, birth_generation
         self.generation += 1
         
         # Update fitness history
-        fitnesses = [s.fitness for s in self.population]
-        self.best_fitness_history.append(max(fitnesses))
-        self.average_fitness_history.append(np.mean(fitnesses))
-        
-        logger.info(f"Generation {self.generation}: Best fitness = {max(fitnesses):.2f}, "
-                   f"Average fitness = {np.mean(fitnesses):.2f}")
+        evaluated = self.fitness[~np.isnan(self.fitness)]
+        best_fitness = float(evaluated.max()) if len(evaluated) else 0.0
+        average_fitness = float(evaluated.mean()) if len(evaluated) else 0.0
+        self._recent_best.append(best_fitness)
+        self.best_fitness_history.append(best_fitness)
+        self.average_fitness_history.append(average_fitness)
+        
+        logger.info(f"Generation {self.generation}: Best fitness = {best_fitness:.2f}, "
+                   f"Average fitness = {average_fitness:.2f}")
     
-    def evolve(self, simulation_function) -> Strategy:
+    def evolve(self, simulation_function: Optional[Callable] = None,
+               batch_simulation_function: Optional[Callable] = None,
+               executor: Optional[Executor] = None) -> Strategy:
         """
         Evolve strategies for multiple generations
         
         Args:
-            simulation_function: Function that runs simulation and returns results
+            simulation_function: Function that runs simulation for one strategy
+                and returns results
+            batch_simulation_function: Function that takes an array of gene
+                rows and returns an array of results with columns ordered as
+                RESULT_NAMES; preferred over simulation_function when given
+            executor: Existing executor to run simulation_function on instead
+                of starting one per call; it is left open for the caller
             
         Returns:
             Best evolved strategy
         """
-        if not self.population:
+        if batch_simulation_function is not None:
+            return self._evolve(batch_simulation_function)
+        if simulation_function is None:
+            raise ValueError("A simulation function is required")
+        if executor is not None:
+            return self._evolve(partial(self.simulate_each, simulation_function,
+                                        executor=executor))
+        if self.n_workers <= 1:
+            return self._evolve(partial(self.simulate_each, simulation_function))
+        
+        if self.use_threads:
+            executor = ThreadPoolExecutor(max_workers=self.n_workers)
+        else:
+            # Numba's parallel thread pool does not survive a fork, so start
+            # workers fresh once the JIT kernels may have run in this process
+            context = multiprocessing.get_context('spawn') if NUMBA_AVAILABLE else None
+            executor = ProcessPoolExecutor(max_workers=self.n_workers, mp_context=context)
+        
+        with executor:
+            return self._evolve(partial(self.simulate_each, simulation_function,
+                                        executor=executor))
+    
+    def _evaluate_pending(self, batch_simulation_function: Callable) -> None:
+        """Evaluate fitness for strategies that have not been evaluated yet"""
+        pending = np.flatnonzero(np.isnan(self.fitness))
+        if len(pending):
+            self.fitness[pending] = self._cached_fitness(self.genes[pending],
+                                                         batch_simulation_function)
+    
+    def _evolve(self, batch_simulation_function: Callable) -> Strategy:
+        """Run the generation loop with a batched simulation function"""
+        if not len(self.genes):
             self.initialize_population()
         
         for generation in range(self.max_generations):
-            # Evaluate fitness for all strategies
-            for strategy in self.population:
-                if strategy.fitness == 0.0:  # Only evaluate if not already evaluated
-                    results = simulation_function(strategy)
-                    strategy.fitness = self.evaluate_fitness(strategy, results)
+            self._evaluate_pending(batch_simulation_function)
             
             # Evolve to next generation
             self.evolve_generation()
             
-            # Check for convergence
-            if len(self.best_fitness_history) > 10:
-                recent_improvement = (self.best_fitness_history[-1] - 
-                                    self.best_fitness_history[-10])
+            # Check for convergence once more than 10 generations have run,
+            # comparing against the best fitness 10 entries back
+            if len(self._recent_best) == self._recent_best.maxlen:
+                recent_improvement = self._recent_best[-1] - self._recent_best[1]
                 if recent_improvement < 0.01:
                     logger.info("Convergence detected, stopping evolution")
                     break
         
+        # Evaluate the final generation's new strategies before picking the best
+        self._evaluate_pending(batch_simulation_function)
+        
         # Return best strategy
-        best_strategy = max(self.population, key=lambda s: s.fitness)
+        best_strategy = self.get_strategy(self.best_index()).copy()
         logger.info(f"Evolution complete. Best fitness: {best_strategy.fitness:.2f}")
         
         return best_strategy
     
     def save_population(self, filename: str) -> None:
-        """Save current population to file"""
+        """
+        Save current population to a compressed NumPy archive
+        
+        Filenames ending in ``.json`` are written with save_population_json
+        instead; otherwise ``.npz`` is appended if the name lacks it.
+        """
+        if filename.endswith('.json'):
+            self.save_population_json(filename)
+            return
+        
+        filename = _npz_path(filename)
+        np.savez_compressed(
+            filename,
+            genes=self.genes,
+            fitness=self.fitness,
+            birth_generation=self.birth_generation,
+            best_fitness_history=np.asarray(self.best_fitness_history, dtype=np.float64),
+            average_fitness_history=np.asarray(self.average_fitness_history, dtype=np.float64),
+            generation=np.array([self.generation])
+        )
+        
+        logger.info(f"Population saved to {filename}")
+    
+    def save_population_json(self, filename: str) -> None:
+        """Save current population to a JSON file"""
         data = {
             'generation': self.generation,
             'population': [s.to_dict() for s in self.population],
@@ -310,13 +700,30 @@ class GeneticAlgorithm:
             }
         }
         
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        _dump_json(filename, data)
         
         logger.info(f"Population saved to {filename}")
     
     def load_population(self, filename: str) -> None:
-        """Load population from file"""
+        """Load population from a file written by save_population"""
+        if filename.endswith('.json'):
+            self.load_population_json(filename)
+            return
+        
+        filename = _npz_path(filename)
+        with np.load(filename) as data:
+            self.genes = data['genes'].astype(np.float32)
+            self.fitness = data['fitness'].astype(np.float64)
+            self.birth_generation = data['birth_generation'].astype(np.int32)
+            self.best_fitness_history = data['best_fitness_history'].tolist()
+            self.average_fitness_history = data['average_fitness_history'].tolist()
+            self.generation = int(data['generation'][0])
+        self._recent_best = deque(self.best_fitness_history[-11:], maxlen=11)
+        
+        logger.info(f"Population loaded from {filename}")
+    
+    def load_population_json(self, filename: str) -> None:
+        """Load population from a JSON file written by save_population_json"""
         with open(filename, 'r') as f:
             data = json.load(f)
         
@@ -324,22 +731,22 @@ class GeneticAlgorithm:
         self.population = [Strategy.from_dict(s) for s in data['population']]
         self.best_fitness_history = data['fitness_history']['best']
         self.average_fitness_history = data['fitness_history']['average']
+        self._recent_best = deque(self.best_fitness_history[-11:], maxlen=11)
         
         logger.info(f"Population loaded from {filename}")
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get current population statistics"""
-        if not self.population:
+        fitness = self.fitness[~np.isnan(self.fitness)]
+        if not len(fitness):
             return {}
         
-        fitnesses = [s.fitness for s in self.population]
-        
         return {
             'generation': self.generation,
-            'population_size': len(self.population),
-            'best_fitness': max(fitnesses),
-            'worst_fitness': min(fitnesses),
-            'average_fitness': np.mean(fitnesses),
-            'std_fitness': np.std(fitnesses),
-            'best_strategy': max(self.population, key=lambda s: s.fitness).to_dict()
+            'population_size': len(self.genes),
+            'best_fitness': float(fitness.max()),
+            'worst_fitness': float(fitness.min()),
+            'average_fitness': float(fitness.mean()),
+            'std_fitness': float(fitness.std()),
+            'best_strategy': self.get_strategy(self.best_index()).to_dict()
         }
@@ -8,11 +8,166 @@ in the Rock Paper Scissors Battle Royale game.
 import numpy as np
 from typing import List, Tuple, Dict, Any, Optional
 from dataclasses import dataclass
+from functools import lru_cache, partial
+import importlib.util
 import json
 import logging
 
+from ._serialization import _dump_json, _npz_path
+
+# jax is only imported by the first JAX training run, see _jax_functions
+JAX_AVAILABLE = importlib.util.find_spec('jax') is not None
+
+try:
+    from scipy.linalg.blas import get_blas_funcs
+    from scipy.special import expit
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+
+# Below this many elements the numba dispatch costs more than it saves
+_PARALLEL_RELU_MIN_SIZE = 4096
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _relu_parallel(x):
+        """Multi-threaded in-place ReLU over a C-contiguous array"""
+        flat = x.reshape(-1)
+        for i in prange(flat.size):
+            if flat[i] < 0:
+                flat[i] = 0
+
+def _relu(x: np.ndarray) -> np.ndarray:
+    if NUMBA_AVAILABLE and x.size > _PARALLEL_RELU_MIN_SIZE and x.flags.c_contiguous:
+        _relu_parallel(x)
+        return x
+    return np.maximum(x, 0, out=x)
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    if SCIPY_AVAILABLE:
+        return expit(x, out=x)
+    np.clip(x, -500, 500, out=x)
+    np.negative(x, out=x)
+    np.exp(x, out=x)
+    x += 1
+    return np.reciprocal(x, out=x)
+
+def _tanh(x: np.ndarray) -> np.ndarray:
+    return np.tanh(x, out=x)
+
+def _linear(x: np.ndarray) -> np.ndarray:
+    return x
+
+# Derivatives expressed in terms of the activation output, which the forward
+# pass already stores, so no pre-activation copy is needed for backprop
+def _relu_derivative(a: np.ndarray) -> np.ndarray:
+    return (a > 0).astype(a.dtype)
+
+def _sigmoid_derivative(a: np.ndarray) -> np.ndarray:
+    d = 1 - a
+    d *= a
+    return d
+
+def _tanh_derivative(a: np.ndarray) -> np.ndarray:
+    return 1 - a * a
+
+def _linear_derivative(a: np.ndarray) -> np.ndarray:
+    return np.ones_like(a)
+
+def _loss_and_err(y_pred: np.ndarray, y_true: np.ndarray) -> Tuple[float, np.ndarray]:
+    """Mean squared error together with the output error y_pred - y_true"""
+    err = y_pred - y_true
+    return float(np.vdot(err, err)) / err.size, err
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _loss_and_err(y_pred, y_true):
+        """Mean squared error together with the output error, in one pass"""
+        err = np.empty_like(y_pred)
+        total = 0.0
+        for i in range(y_pred.shape[0]):
+            for j in range(y_pred.shape[1]):
+                e = y_pred[i, j] - y_true[i, j]
+                err[i, j] = e
+                total += e * e
+        return total / y_pred.size, err
+
+# In-place activation and output-based derivative per activation name
+ACTIVATIONS = {
+    'relu': (_relu, _relu_derivative),
+    'sigmoid': (_sigmoid, _sigmoid_derivative),
+    'tanh': (_tanh, _tanh_derivative),
+    'linear': (_linear, _linear_derivative),
+}
+
+@lru_cache(maxsize=None)
+def _jax_functions():
+    """Import jax and build the jitted training helpers, once per process"""
+    import jax
+    import jax.numpy as jnp
+    
+    jax_activations = {
+        'relu': jax.nn.relu,
+        'sigmoid': jax.nn.sigmoid,
+        'tanh': jnp.tanh,
+        'linear': lambda x: x,
+    }
+    
+    def _jax_forward(params, x, activation):
+        """Forward pass over (weights, biases) parameter tuples"""
+        weights, biases = params
+        for weight, bias in zip(weights[:-1], biases[:-1]):
+            x = jax_activations[activation](jnp.dot(x, weight) + bias)
+        return jnp.dot(x, weights[-1]) + biases[-1]
+    
+    def _jax_loss(params, x, y, activation):
+        """Mean squared error, with the predictions as auxiliary output"""
+        y_pred = _jax_forward(params, x, activation)
+        return jnp.mean((y_pred - y) ** 2), y_pred
+    
+    def _jax_step(params, x, y, learning_rate, activation):
+        """One SGD step returning updated parameters, loss and accuracy"""
+        (loss, y_pred), grads = jax.value_and_grad(_jax_loss, has_aux=True)(
+            params, x, y, activation)
+        params = jax.tree_util.tree_map(lambda p, g: p - learning_rate * g, params, grads)
+        accuracy = jnp.mean(jnp.argmax(y_pred, axis=1) == jnp.argmax(y, axis=1))
+        return params, loss, accuracy
+    
+    @partial(jax.jit, static_argnames=('activation',))
+    def _jax_epoch(params, x_batches, y_batches, learning_rate, activation):
+        """Run SGD over stacked equal-sized batches on device with lax.scan"""
+        def body(params, batch):
+            params, loss, accuracy = _jax_step(params, *batch, learning_rate, activation)
+            return params, (loss, accuracy)
+        return jax.lax.scan(body, params, (x_batches, y_batches))
+    
+    _jax_step_jit = jax.jit(_jax_step, static_argnames=('activation',))
+    
+    @partial(jax.jit, static_argnames=('activation',))
+    def _jax_evaluate(params, x, y, activation):
+        """Loss and accuracy of the network on a dataset"""
+        loss, y_pred = _jax_loss(params, x, y, activation)
+        return loss, jnp.mean(jnp.argmax(y_pred, axis=1) == jnp.argmax(y, axis=1))
+    
+    return jnp, _jax_epoch, _jax_step_jit, _jax_evaluate
+
+# torch.nn module names for each activation
+_TORCH_ACTIVATIONS = {
+    'relu': 'ReLU',
+    'sigmoid': 'Sigmoid',
+    'tanh': 'Tanh',
+    'linear': 'Identity',
+}
+
 @dataclass
 class NetworkConfig:
     """Configuration for neural network"""
@@ -22,6 +177,7 @@ class NetworkConfig:
     learning_rate: float = 0.001
     dropout_rate: float = 0.2
     activation: str = 'relu'
+    backend: str = 'numpy'  # 'numpy', 'jax' or 'torch'
     
     def __post_init__(self):
         if self.hidden_sizes is None:
@@ -32,20 +188,26 @@ class NeuralNetwork:
     Simple neural network implementation for strategy learning
     """
     
-    def __init__(self, config: NetworkConfig):
+    def __init__(self, config: NetworkConfig, seed: Optional[int] = None):
         """
         Initialize neural network
         
         Args:
             config: Network configuration
+            seed: Seed for weight initialization and shuffling, for reproducible runs
         """
         self.config = config
+        self.rng = np.random.default_rng(seed)
         self.weights = []
         self.biases = []
-        self.layers = []
+        self._bufs = None  # Reusable per-layer output buffers for forward()
         
         # Initialize network architecture
         self._initialize_weights()
+        self._bind_activation()
+        
+        # Input plus each layer's output, filled in by forward() for backprop
+        self.layers = [None] * (len(self.weights) + 1)
         
         logger.info(f"Neural network initialized with config: {config}")
     
@@ -59,44 +221,26 @@ class NeuralNetwork:
             fan_out = layer_sizes[i + 1]
             limit = np.sqrt(6.0 / (fan_in + fan_out))
             
-            weight = np.random.uniform(-limit, limit, (fan_in, fan_out))
-            bias = np.zeros((fan_out,))
+            weight = self.rng.uniform(-limit, limit, (fan_in, fan_out)).astype(np.float32)
+            bias = np.zeros((fan_out,), dtype=np.float32)
             
             self.weights.append(weight)
             self.biases.append(bias)
     
-    def _activation(self, x: np.ndarray, activation: str = None) -> np.ndarray:
-        """Apply activation function"""
-        if activation is None:
-            activation = self.config.activation
-        
-        if activation == 'relu':
-            return np.maximum(0, x)
-        elif activation == 'sigmoid':
-            return 1 / (1 + np.exp(-np.clip(x, -500, 500)))
-        elif activation == 'tanh':
-            return np.tanh(x)
-        elif activation == 'linear':
-            return x
-        else:
-            raise ValueError(f"Unknown activation function: {activation}")
+    def _bind_activation(self):
+        """Resolve the configured activation to its functions once"""
+        if self.config.activation not in ACTIVATIONS:
+            raise ValueError(f"Unknown activation function: {self.config.activation}")
+        self._act, self._act_deriv = ACTIVATIONS[self.config.activation]
     
-    def _activation_derivative(self, x: np.ndarray, activation: str = None) -> np.ndarray:
-        """Compute activation function derivative"""
-        if activation is None:
-            activation = self.config.activation
-        
-        if activation == 'relu':
-            return (x > 0).astype(float)
-        elif activation == 'sigmoid':
-            s = self._activation(x, activation)
-            return s * (1 - s)
-        elif activation == 'tanh':
-            return 1 - np.tanh(x) ** 2
-        elif activation == 'linear':
-            return np.ones_like(x)
-        else:
-            raise ValueError(f"Unknown activation function: {activation}")
+    def _layer_buffers(self, x: np.ndarray) -> List[np.ndarray]:
+        """Per-layer output buffers sized for the batch, grown only when needed"""
+        n_rows = x.shape[0]
+        dtype = self.weights[0].dtype
+        if self._bufs is None or self._bufs[0].shape[0] < n_rows or self._bufs[0].dtype != dtype:
+            self._bufs = [np.empty((n_rows, w.shape[1]), dtype=dtype) for w in self.weights]
+        # Leading-row slices of C-ordered buffers stay contiguous, as np.dot(out=) requires
+        return [buf[:n_rows] for buf in self._bufs]
     
     def forward(self, x: np.ndarray) -> np.ndarray:
         """
@@ -106,21 +250,27 @@ class NeuralNetwork:
             x: Input features (batch_size, input_size)
             
         Returns:
-            Output predictions (batch_size, output_size)
+            Output predictions (batch_size, output_size), held in an internal
+            buffer that the next forward pass overwrites
         """
-        self.layers = [x]  # Store activations for backprop
+        x = np.asarray(x, dtype=self.weights[0].dtype)
+        bufs = self._layer_buffers(x)
+        layers = self.layers  # Store activations for backprop
+        layers[0] = x
         
         current = x
         
         # Hidden layers
         for i in range(len(self.weights) - 1):
-            z = np.dot(current, self.weights[i]) + self.biases[i]
-            current = self._activation(z)
-            self.layers.append(current)
+            z = np.dot(current, self.weights[i], out=bufs[i])
+            z += self.biases[i]
+            current = self._act(z)
+            layers[i + 1] = current
         
         # Output layer (no activation for regression)
-        z = np.dot(current, self.weights[-1]) + self.biases[-1]
-        self.layers.append(z)
+        z = np.dot(current, self.weights[-1], out=bufs[-1])
+        z += self.biases[-1]
+        layers[-1] = z
         
         return z
     
@@ -134,7 +284,7 @@ class NeuralNetwork:
         Returns:
             Predictions
         """
-        return self.forward(x)
+        return self.forward(x).copy()
     
     def train(self, X: np.ndarray, y: np.ndarray, epochs: int = 100, 
               batch_size: int = 32, validation_split: float = 0.2) -> Dict[str, List[float]]:
@@ -151,12 +301,21 @@ class NeuralNetwork:
         Returns:
             Training history
         """
+        # Match the float32 weights once here rather than per batch
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        y = np.ascontiguousarray(y, dtype=np.float32)
+        
+        if self.config.backend == 'jax':
+            return self._train_jax(X, y, epochs, batch_size, validation_split)
+        if self.config.backend == 'torch':
+            return self._train_torch(X, y, epochs, batch_size, validation_split)
+        
         # Split data
         n_samples = X.shape[0]
         n_val = int(n_samples * validation_split)
         n_train = n_samples - n_val
         
-        indices = np.random.permutation(n_samples)
+        indices = self.rng.permutation(n_samples)
         train_indices = indices[:n_train]
         val_indices = indices[n_train:]
         
@@ -173,31 +332,36 @@ class NeuralNetwork:
         
         logger.info(f"Starting training for {epochs} epochs...")
         
+        # Shuffled copies of the training data, refilled every epoch
+        X_shuf = np.empty_like(X_train)
+        y_shuf = np.empty_like(y_train)
+        
         for epoch in range(epochs):
-            # Shuffle training data
-            train_indices = np.random.permutation(n_train)
+            # Shuffle training data once per epoch so batches are contiguous slices
+            train_indices = self.rng.permutation(n_train)
+            np.take(X_train, train_indices, axis=0, out=X_shuf)
+            np.take(y_train, train_indices, axis=0, out=y_shuf)
             
             epoch_train_loss = 0
             epoch_train_acc = 0
             
             # Mini-batch training
             for i in range(0, n_train, batch_size):
-                batch_indices = train_indices[i:i + batch_size]
-                X_batch = X_train[batch_indices]
-                y_batch = y_train[batch_indices]
+                X_batch = X_shuf[i:i + batch_size]
+                y_batch = y_shuf[i:i + batch_size]
                 
                 # Forward pass
                 y_pred = self.forward(X_batch)
                 
-                # Compute loss and accuracy
-                loss = self._compute_loss(y_pred, y_batch)
+                # Compute loss, output error and accuracy
+                loss, output_error = _loss_and_err(y_pred, y_batch)
                 acc = self._compute_accuracy(y_pred, y_batch)
                 
                 epoch_train_loss += loss
                 epoch_train_acc += acc
                 
                 # Backward pass
-                self._backward_pass(y_batch)
+                self._backward_pass(output_error)
             
             # Validation
             val_pred = self.predict(X_val)
@@ -217,86 +381,285 @@ class NeuralNetwork:
         logger.info("Training completed!")
         return history
     
+    def _train_jax(self, X: np.ndarray, y: np.ndarray, epochs: int,
+                   batch_size: int, validation_split: float) -> Dict[str, List[float]]:
+        """Train with a jitted JAX step that keeps each epoch on device"""
+        if not JAX_AVAILABLE:
+            raise ImportError("The 'jax' backend requires the jax package")
+        jnp, jax_epoch, jax_step, jax_evaluate = _jax_functions()
+        
+        # Split data
+        n_samples = X.shape[0]
+        n_val = int(n_samples * validation_split)
+        n_train = n_samples - n_val
+        
+        indices = self.rng.permutation(n_samples)
+        X_train, y_train = jnp.asarray(X[indices[:n_train]]), jnp.asarray(y[indices[:n_train]])
+        X_val, y_val = jnp.asarray(X[indices[n_train:]]), jnp.asarray(y[indices[n_train:]])
+        
+        params = ([jnp.asarray(w) for w in self.weights], [jnp.asarray(b) for b in self.biases])
+        activation = self.config.activation
+        learning_rate = self.config.learning_rate
+        n_full = (n_train // batch_size) * batch_size
+        
+        history = {
+            'train_loss': [],
+            'val_loss': [],
+            'train_accuracy': [],
+            'val_accuracy': []
+        }
+        
+        logger.info(f"Starting JAX training for {epochs} epochs...")
+        
+        for epoch in range(epochs):
+            perm = self.rng.permutation(n_train)
+            X_shuf, y_shuf = X_train[perm], y_train[perm]
+            losses, accuracies = [], []
+            
+            # Full batches run as one scan, a trailing partial batch separately
+            if n_full:
+                params, (loss, acc) = jax_epoch(
+                    params,
+                    X_shuf[:n_full].reshape(-1, batch_size, X.shape[1]),
+                    y_shuf[:n_full].reshape(-1, batch_size, y.shape[1]),
+                    learning_rate, activation)
+                losses.append(loss)
+                accuracies.append(acc)
+            if n_full < n_train:
+                params, loss, acc = jax_step(params, X_shuf[n_full:], y_shuf[n_full:],
+                                                  learning_rate, activation)
+                losses.append(loss[None])
+                accuracies.append(acc[None])
+            
+            val_loss, val_acc = jax_evaluate(params, X_val, y_val, activation) if n_val else (0.0, 0.0)
+            
+            history['train_loss'].append(float(jnp.concatenate(losses).mean()))
+            history['val_loss'].append(float(val_loss))
+            history['train_accuracy'].append(float(jnp.concatenate(accuracies).mean()))
+            history['val_accuracy'].append(float(val_acc))
+            
+            if epoch % 10 == 0:
+                logger.info(f"Epoch {epoch}: Train Loss = {history['train_loss'][-1]:.4f}, "
+                           f"Val Loss = {history['val_loss'][-1]:.4f}, "
+                           f"Val Acc = {history['val_accuracy'][-1]:.4f}")
+        
+        self.weights = [np.array(w, dtype=np.float32) for w in params[0]]
+        self.biases = [np.array(b, dtype=np.float32) for b in params[1]]
+        
+        logger.info("Training completed!")
+        return history
+    
+    def _train_torch(self, X: np.ndarray, y: np.ndarray, epochs: int,
+                     batch_size: int, validation_split: float) -> Dict[str, List[float]]:
+        """Train a torch.nn.Sequential copy of the network, compiled when supported"""
+        # Imported here so the opt-in backend costs nothing to other backends
+        try:
+            import torch
+        except ImportError:
+            raise ImportError("The 'torch' backend requires the torch package") from None
+        
+        # Split data
+        n_samples = X.shape[0]
+        n_val = int(n_samples * validation_split)
+        n_train = n_samples - n_val
+        
+        indices = self.rng.permutation(n_samples)
+        X_train, y_train = torch.from_numpy(X[indices[:n_train]]), torch.from_numpy(y[indices[:n_train]])
+        X_val, y_val = torch.from_numpy(X[indices[n_train:]]), torch.from_numpy(y[indices[n_train:]])
+        
+        # Mirror the current weights; torch.nn.Linear stores them as (out, in)
+        layers = []
+        for i, (weight, bias) in enumerate(zip(self.weights, self.biases)):
+            linear = torch.nn.Linear(*weight.shape)
+            with torch.no_grad():
+                linear.weight.copy_(torch.from_numpy(weight.T))
+                linear.bias.copy_(torch.from_numpy(bias))
+            layers.append(linear)
+            if i < len(self.weights) - 1:
+                layers.append(getattr(torch.nn, _TORCH_ACTIVATIONS[self.config.activation])())
+        
+        model = torch.nn.Sequential(*layers)
+        compiled = torch.compile(model) if hasattr(torch, 'compile') else model
+        optimizer = torch.optim.SGD(model.parameters(), lr=self.config.learning_rate)
+        loss_fn = torch.nn.MSELoss()
+        
+        history = {
+            'train_loss': [],
+            'val_loss': [],
+            'train_accuracy': [],
+            'val_accuracy': []
+        }
+        
+        logger.info(f"Starting torch training for {epochs} epochs...")
+        
+        for epoch in range(epochs):
+            perm = torch.from_numpy(self.rng.permutation(n_train))
+            X_shuf, y_shuf = X_train[perm], y_train[perm]
+            losses, accuracies = [], []
+            
+            for i in range(0, n_train, batch_size):
+                X_batch = X_shuf[i:i + batch_size]
+                y_batch = y_shuf[i:i + batch_size]
+                
+                optimizer.zero_grad()
+                y_pred = compiled(X_batch)
+                loss = loss_fn(y_pred, y_batch)
+                loss.backward()
+                optimizer.step()
+                
+                # Kept as tensors so the loop does not sync per batch
+                losses.append(loss.detach())
+                accuracies.append((y_pred.argmax(dim=1) == y_batch.argmax(dim=1)).float().mean())
+            
+            with torch.no_grad():
+                if n_val:
+                    val_pred = compiled(X_val)
+                    val_loss = loss_fn(val_pred, y_val).item()
+                    val_acc = (val_pred.argmax(dim=1) == y_val.argmax(dim=1)).float().mean().item()
+                else:
+                    val_loss, val_acc = 0.0, 0.0
+            
+            history['train_loss'].append(torch.stack(losses).mean().item())
+            history['val_loss'].append(val_loss)
+            history['train_accuracy'].append(torch.stack(accuracies).mean().item())
+            history['val_accuracy'].append(val_acc)
+            
+            if epoch % 10 == 0:
+                logger.info(f"Epoch {epoch}: Train Loss = {history['train_loss'][-1]:.4f}, "
+                           f"Val Loss = {val_loss:.4f}, Val Acc = {val_acc:.4f}")
+        
+        linears = [layer for layer in model if isinstance(layer, torch.nn.Linear)]
+        self.weights = [np.ascontiguousarray(layer.weight.detach().numpy().T) for layer in linears]
+        self.biases = [layer.bias.detach().numpy().copy() for layer in linears]
+        
+        logger.info("Training completed!")
+        return history
+    
     def _compute_loss(self, y_pred: np.ndarray, y_true: np.ndarray) -> float:
         """Compute mean squared error loss"""
         return np.mean((y_pred - y_true) ** 2)
     
     def _compute_accuracy(self, y_pred: np.ndarray, y_true: np.ndarray) -> float:
         """Compute accuracy (for classification)"""
+        predictions = np.argmax(y_pred, axis=1)
+        
         if y_true.ndim == 1:
-            # Convert to one-hot if needed
-            y_true_onehot = np.eye(self.config.output_size)[y_true.astype(int)]
+            # Integer labels compare directly, no one-hot expansion needed
+            true_labels = y_true.astype(np.int32)
         else:
-            y_true_onehot = y_true
+            true_labels = np.argmax(y_true, axis=1)
         
-        predictions = np.argmax(y_pred, axis=1)
-        true_labels = np.argmax(y_true_onehot, axis=1)
-        
-        return np.mean(predictions == true_labels)
+        return float((predictions == true_labels).mean())
     
-    def _backward_pass(self, y_true: np.ndarray):
-        """Backward pass for gradient computation"""
+    def _backward_pass(self, output_error: np.ndarray):
+        """
+        Backward pass for gradient computation
+        
+        Args:
+            output_error: Prediction minus target for the last forward batch
+        """
         # This is a simplified implementation
         # In practice, you'd want to use a proper deep learning framework
         
-        # Compute output error
-        y_pred = self.layers[-1]
-        output_error = y_pred - y_true
-        
         # Backpropagate through layers
         error = output_error
+        learning_rate = self.config.learning_rate
         
         for i in range(len(self.weights) - 1, -1, -1):
-            # Compute gradients
-            if i == len(self.weights) - 1:
-                # Output layer
-                grad_w = np.dot(self.layers[i].T, error)
-                grad_b = np.mean(error, axis=0)
+            layer = self.layers[i]
+            weight = self.weights[i]
+            
+            # Propagate error to the activations feeding this layer, using the
+            # weights from before this step's update
+            if i > 0:
+                prev_error = np.dot(error, weight.T)
+                prev_error *= self._act_deriv(layer)
+            
+            # Update weights in place: W -= lr * layer.T @ error
+            if SCIPY_AVAILABLE and weight.flags.c_contiguous:
+                # weight.T is Fortran-ordered, so GEMM accumulates into it
+                # directly: W.T = -lr * error.T @ layer + W.T
+                gemm = get_blas_funcs('gemm', (weight,))
+                gemm(-learning_rate, error, layer, beta=1.0, c=weight.T,
+                     trans_a=True, overwrite_c=True)
             else:
-                # Hidden layers
-                grad_w = np.dot(self.layers[i].T, error)
-                grad_b = np.mean(error, axis=0)
-                
-                # Propagate error backward
-                error = np.dot(error, self.weights[i].T)
-                error *= self._activation_derivative(self.layers[i])
+                weight -= learning_rate * np.dot(layer.T, error)
+            self.biases[i] -= (learning_rate / error.shape[0]) * error.sum(axis=0)
             
-            # Update weights and biases
-            self.weights[i] -= self.config.learning_rate * grad_w
-            self.biases[i] -= self.config.learning_rate * grad_b
+            if i > 0:
+                error = prev_error
     
-    def save(self, filepath: str):
-        """Save model to file"""
-        model_data = {
-            'config': {
-                'input_size': self.config.input_size,
-                'hidden_sizes': self.config.hidden_sizes,
-                'output_size': self.config.output_size,
-                'learning_rate': self.config.learning_rate,
-                'dropout_rate': self.config.dropout_rate,
-                'activation': self.config.activation
-            },
-            'weights': [w.tolist() for w in self.weights],
-            'biases': [b.tolist() for b in self.biases]
+    def save(self, filepath: str, format: Optional[str] = None):
+        """
+        Save model to file
+        
+        Args:
+            filepath: Destination path
+            format: 'npz' (compressed binary) or 'json'; inferred from the
+                extension when omitted, with anything but ``.json`` saved as npz
+                (``.npz`` is appended when missing)
+        """
+        if format is None:
+            format = 'json' if filepath.endswith('.json') else 'npz'
+        
+        config = {
+            'input_size': self.config.input_size,
+            'hidden_sizes': self.config.hidden_sizes,
+            'output_size': self.config.output_size,
+            'learning_rate': self.config.learning_rate,
+            'dropout_rate': self.config.dropout_rate,
+            'activation': self.config.activation,
+            'backend': self.config.backend
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(model_data, f, indent=2)
+        if format == 'npz':
+            filepath = _npz_path(filepath)
+            arrays = {f'W{i}': w for i, w in enumerate(self.weights)}
+            arrays.update({f'b{i}': b for i, b in enumerate(self.biases)})
+            np.savez_compressed(filepath, config=np.array(json.dumps(config)), **arrays)
+        elif format == 'json':
+            model_data = {
+                'config': config,
+                'weights': self.weights,
+                'biases': self.biases
+            }
+            
+            _dump_json(filepath, model_data)
+        else:
+            raise ValueError(f"Unknown save format: {format}")
         
         logger.info(f"Model saved to {filepath}")
     
-    def load(self, filepath: str):
-        """Load model from file"""
-        with open(filepath, 'r') as f:
-            model_data = json.load(f)
+    def load(self, filepath: str, format: Optional[str] = None):
+        """Load model from a file written by save"""
+        if format is None:
+            format = 'json' if filepath.endswith('.json') else 'npz'
+        
+        if format == 'npz':
+            filepath = _npz_path(filepath)
+            with np.load(filepath) as data:
+                config_data = json.loads(str(data['config']))
+                n_layers = len(config_data['hidden_sizes']) + 1
+                weights = [data[f'W{i}'] for i in range(n_layers)]
+                biases = [data[f'b{i}'] for i in range(n_layers)]
+        elif format == 'json':
+            with open(filepath, 'r') as f:
+                model_data = json.load(f)
+            config_data = model_data['config']
+            weights = model_data['weights']
+            biases = model_data['biases']
+        else:
+            raise ValueError(f"Unknown save format: {format}")
         
         # Reconstruct config
-        config_data = model_data['config']
         self.config = NetworkConfig(**config_data)
+        self._bind_activation()
         
         # Reconstruct weights and biases
-        self.weights = [np.array(w) for w in model_data['weights']]
-        self.biases = [np.array(b) for b in model_data['biases']]
+        self.weights = [np.array(w, dtype=np.float32) for w in weights]
+        self.biases = [np.array(b, dtype=np.float32) for b in biases]
+        self.layers = [None] * (len(self.weights) + 1)
+        self._bufs = None
         
         logger.info(f"Model loaded from {filepath}")
     
@@ -6,13 +6,78 @@ in the Rock Paper Scissors Battle Royale game.
 """
 
 import numpy as np
-from typing import List, Tuple, Dict, Any, Optional
+from typing import Tuple, Dict, Any, Optional
 from dataclasses import dataclass
 import json
 import logging
 
+from ._serialization import _dump_json, _npz_path
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+
+def _q_update(q_table, state_idx, action, reward, next_state_idx, done,
+              learning_rate, discount_factor):
+    """Apply the Q-learning update rule to one (state, action) entry"""
+    if done:
+        target_q = reward
+    else:
+        target_q = reward + discount_factor * q_table[next_state_idx].max()
+    q_table[state_idx, action] += learning_rate * (target_q - q_table[state_idx, action])
+
+
+# 64-bit FNV-1a parameters for hashing discretized states
+_FNV_OFFSET = 14695981039346656037
+_FNV_PRIME = 1099511628211
+_UINT64_MASK = (1 << 64) - 1
+
+
+def _hash_state(state, size):
+    """FNV-1a hash of a state rounded to 2 decimals, reduced to a table index"""
+    h = _FNV_OFFSET
+    for bucket in np.rint(state * 100).astype(np.int64).tolist():
+        h = ((h ^ (bucket & _UINT64_MASK)) * _FNV_PRIME) & _UINT64_MASK
+    return h % size
+
+
+def _hash_states(states, size):
+    """Table indices for each row of a (n_states, state_size) array"""
+    out = np.empty(states.shape[0], dtype=np.int64)
+    for i in range(states.shape[0]):
+        out[i] = _hash_state(states[i], size)
+    return out
+
+
+def _q_update_batch(q_table, state_idx, actions, rewards, next_state_idx, dones,
+                    learning_rate, discount_factor):
+    """Apply _q_update to a batch of transitions, in order"""
+    for i in range(state_idx.shape[0]):
+        _q_update(q_table, state_idx[i], actions[i], rewards[i], next_state_idx[i], dones[i],
+                  learning_rate, discount_factor)
+
+
+if NUMBA_AVAILABLE:
+    _q_update = njit(cache=True, fastmath=True)(_q_update)
+
+    @njit(cache=True)
+    def _hash_state(state, size):
+        """FNV-1a hash of a state rounded to 2 decimals, reduced to a table index"""
+        h = np.uint64(_FNV_OFFSET)
+        for v in state:
+            # int64 -> uint64 wraps negatives the same way as the masked version
+            h ^= np.uint64(np.int64(np.rint(v * 100.0)))
+            h *= np.uint64(_FNV_PRIME)
+        return h % np.uint64(size)
+
+    _hash_states = njit(cache=True)(_hash_states)
+    _q_update_batch = njit(cache=True)(_q_update_batch)
+
 @dataclass
 class RLConfig:
     """Configuration for reinforcement learning"""
@@ -30,7 +95,8 @@ class QLearning:
     Q-Learning implementation for strategy learning
     """
     
-    def __init__(self, state_size: int, action_size: int, config: RLConfig):
+    def __init__(self, state_size: int, action_size: int, config: RLConfig,
+                 seed: Optional[int] = None):
         """
         Initialize Q-Learning agent
         
@@ -38,10 +104,12 @@ class QLearning:
             state_size: Size of state space
             action_size: Size of action space
             config: RL configuration
+            seed: Seed for the agent's random generator, for reproducible runs
         """
         self.state_size = state_size
         self.action_size = action_size
         self.config = config
+        self.rng = np.random.default_rng(seed)
         
         # Q-table
         self.q_table = np.zeros((state_size, action_size))
@@ -49,13 +117,24 @@ class QLearning:
         # Experience replay
         self.memory = []
         
+        # Epsilon follows a schedule over the number of updates, starting
+        # from config.epsilon, instead of being decayed in config every step
+        self.steps = 0
+        
         logger.info(f"Q-Learning agent initialized: state_size={state_size}, action_size={action_size}")
     
+    @property
+    def epsilon(self) -> float:
+        """Exploration rate after self.steps updates"""
+        config = self.config
+        if config.epsilon <= config.epsilon_min:
+            return config.epsilon
+        return max(config.epsilon_min, config.epsilon * config.epsilon_decay ** self.steps)
+    
     def get_state_index(self, state: np.ndarray) -> int:
         """Convert continuous state to discrete index"""
         # Simple discretization - in practice, you'd want more sophisticated methods
-        state_hash = hash(tuple(np.round(state, 2)))
-        return abs(state_hash) % self.state_size
+        return int(_hash_state(np.asarray(state, dtype=np.float64), self.state_size))
     
     def choose_action(self, state: np.ndarray, training: bool = True) -> int:
         """
@@ -68,14 +147,13 @@ class QLearning:
         Returns:
             Action index
         """
-        state_idx = self.get_state_index(state)
-        
-        if training and np.random.random() < self.config.epsilon:
-            # Explore
-            return np.random.randint(self.action_size)
-        else:
-            # Exploit
-            return np.argmax(self.q_table[state_idx])
+        return self.choose_action_index(self.get_state_index(state), training)
+    
+    def choose_action_index(self, state_idx: int, training: bool = True) -> int:
+        """Choose an epsilon-greedy action for an already discretized state"""
+        if training and self.rng.random() < self.epsilon:
+            return int(self.rng.integers(self.action_size))
+        return int(self.q_table[state_idx].argmax())
     
     def update_q_table(self, state: np.ndarray, action: int, reward: float, 
                       next_state: np.ndarray, done: bool):
@@ -89,57 +167,97 @@ class QLearning:
             next_state: Next state
             done: Whether episode is done
         """
-        state_idx = self.get_state_index(state)
-        next_state_idx = self.get_state_index(next_state)
-        
-        # Q-learning update
-        current_q = self.q_table[state_idx, action]
-        
-        if done:
-            target_q = reward
-        else:
-            target_q = reward + self.config.discount_factor * np.max(self.q_table[next_state_idx])
-        
-        # Update Q-value
-        self.q_table[state_idx, action] += self.config.learning_rate * (target_q - current_q)
-        
-        # Decay epsilon
-        if self.config.epsilon > self.config.epsilon_min:
-            self.config.epsilon *= self.config.epsilon_decay
+        self.update_q_index(self.get_state_index(state), action, reward,
+                            self.get_state_index(next_state), done)
     
-    def save(self, filepath: str):
-        """Save Q-table to file"""
-        model_data = {
-            'q_table': self.q_table.tolist(),
-            'config': {
-                'learning_rate': self.config.learning_rate,
-                'discount_factor': self.config.discount_factor,
-                'epsilon': self.config.epsilon,
-                'epsilon_decay': self.config.epsilon_decay,
-                'epsilon_min': self.config.epsilon_min
-            }
+    def update_q_index(self, state_idx: int, action: int, reward: float,
+                       next_state_idx: int, done: bool):
+        """Update Q-table for already discretized states"""
+        _q_update(self.q_table, state_idx, action, float(reward), next_state_idx, bool(done),
+                  self.config.learning_rate, self.config.discount_factor)
+        self.steps += 1
+    
+    def choose_actions_index(self, state_idx: np.ndarray, training: bool = True) -> np.ndarray:
+        """Epsilon-greedy actions for a batch of discretized states"""
+        greedy = self.q_table[state_idx].argmax(axis=1)
+        if not training:
+            return greedy
+        
+        n = len(state_idx)
+        explore = self.rng.random(n) < self.epsilon
+        return np.where(explore, self.rng.integers(self.action_size, size=n), greedy)
+    
+    def update_q_batch(self, state_idx: np.ndarray, actions: np.ndarray, rewards: np.ndarray,
+                       next_state_idx: np.ndarray, dones: np.ndarray):
+        """Update Q-table for a batch of transitions between discretized states"""
+        _q_update_batch(self.q_table, state_idx, actions, rewards, next_state_idx, dones,
+                        self.config.learning_rate, self.config.discount_factor)
+        self.steps += len(state_idx)
+    
+    def save(self, filepath: str, format: Optional[str] = None):
+        """
+        Save Q-table to file
+        
+        Args:
+            filepath: Destination path
+            format: 'npz' (compressed binary) or 'json'; inferred from the
+                extension when omitted, with anything but ``.json`` saved as npz
+                (``.npz`` is appended when missing)
+        """
+        if format is None:
+            format = 'json' if filepath.endswith('.json') else 'npz'
+        
+        config = {
+            'learning_rate': self.config.learning_rate,
+            'discount_factor': self.config.discount_factor,
+            'epsilon': self.epsilon,
+            'epsilon_decay': self.config.epsilon_decay,
+            'epsilon_min': self.config.epsilon_min
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(model_data, f, indent=2)
+        if format == 'npz':
+            filepath = _npz_path(filepath)
+            np.savez_compressed(filepath, q_table=self.q_table, config=np.array(json.dumps(config)))
+        elif format == 'json':
+            model_data = {
+                'q_table': self.q_table,
+                'config': config
+            }
+            
+            _dump_json(filepath, model_data)
+        else:
+            raise ValueError(f"Unknown save format: {format}")
         
         logger.info(f"Q-table saved to {filepath}")
     
-    def load(self, filepath: str):
-        """Load Q-table from file"""
-        with open(filepath, 'r') as f:
-            model_data = json.load(f)
-        
-        self.q_table = np.array(model_data['q_table'])
+    def load(self, filepath: str, format: Optional[str] = None):
+        """Load Q-table from a file written by save"""
+        if format is None:
+            format = 'json' if filepath.endswith('.json') else 'npz'
+        
+        if format == 'npz':
+            filepath = _npz_path(filepath)
+            with np.load(filepath) as data:
+                self.q_table = data['q_table']
+                config_data = json.loads(str(data['config']))
+        elif format == 'json':
+            with open(filepath, 'r') as f:
+                model_data = json.load(f)
+            self.q_table = np.array(model_data['q_table'])
+            config_data = model_data['config']
+        else:
+            raise ValueError(f"Unknown save format: {format}")
         
         # Update config
-        config_data = model_data['config']
         self.config.learning_rate = config_data['learning_rate']
         self.config.discount_factor = config_data['discount_factor']
         self.config.epsilon = config_data['epsilon']
         self.config.epsilon_decay = config_data['epsilon_decay']
         self.config.epsilon_min = config_data['epsilon_min']
         
+        # The saved epsilon is where the schedule resumes
+        self.steps = 0
+        
         logger.info(f"Q-table loaded from {filepath}")
 
 class PolicyGradient:
@@ -147,7 +265,8 @@ class PolicyGradient:
     Policy Gradient implementation for strategy learning
     """
     
-    def __init__(self, state_size: int, action_size: int, config: RLConfig):
+    def __init__(self, state_size: int, action_size: int, config: RLConfig,
+                 seed: Optional[int] = None):
         """
         Initialize Policy Gradient agent
         
@@ -155,13 +274,15 @@ class PolicyGradient:
             state_size: Size of state space
             action_size: Size of action space
             config: RL configuration
+            seed: Seed for the agent's random generator, for reproducible runs
         """
         self.state_size = state_size
         self.action_size = action_size
         self.config = config
+        self.rng = np.random.default_rng(seed)
         
         # Policy parameters (simple linear policy)
-        self.theta = np.random.randn(state_size, action_size) * 0.01
+        self.theta = self.rng.standard_normal((state_size, action_size)) * 0.01
         
         # Experience storage
         self.episode_states = []
@@ -186,8 +307,16 @@ class PolicyGradient:
         Returns:
             Action index
         """
-        probs = self.get_action_probabilities(state)
-        return np.random.choice(self.action_size, p=probs)
+        # Gumbel-max trick: argmax(logits + Gumbel noise) samples from softmax(logits)
+        logits = state @ self.theta
+        gumbel = -np.log(-np.log(self.rng.random(self.action_size)))
+        return int((logits + gumbel).argmax())
+    
+    def choose_actions(self, states: np.ndarray) -> np.ndarray:
+        """Sample one action per row of a (n_states, state_size) batch"""
+        logits = states @ self.theta
+        gumbel = -np.log(-np.log(self.rng.random(logits.shape)))
+        return (logits + gumbel).argmax(axis=1)
     
     def store_experience(self, state: np.ndarray, action: int, reward: float):
         """Store experience for episode"""
@@ -237,49 +366,64 @@ class PolicyGradient:
     def _compute_policy_gradient(self, states: np.ndarray, actions: np.ndarray, 
                                 rewards: np.ndarray) -> np.ndarray:
         """Compute policy gradient"""
-        gradient = np.zeros_like(self.theta)
+        T = len(states)
         
-        for t in range(len(states)):
-            state = states[t]
-            action = actions[t]
-            reward = rewards[t]
-            
-            # Get action probabilities
-            probs = self.get_action_probabilities(state)
-            
-            # Compute gradient for this timestep
-            for a in range(self.action_size):
-                if a == action:
-                    gradient[:, a] += reward * state * (1 - probs[a])
-                else:
-                    gradient[:, a] += reward * state * (-probs[a])
-        
-        return gradient / len(states)
+        # Action probabilities for every timestep at once
+        logits = states @ self.theta
+        logits -= logits.max(axis=1, keepdims=True)  # Numerical stability
+        probs = np.exp(logits)
+        probs /= probs.sum(axis=1, keepdims=True)
+        
+        # d log pi(a_t|s_t) / d logits = onehot(a_t) - pi(.|s_t), weighted by reward
+        onehot = np.zeros_like(probs)
+        onehot[np.arange(T), actions] = 1
+        
+        return states.T @ ((onehot - probs) * rewards[:, None]) / T
     
-    def save(self, filepath: str):
-        """Save policy to file"""
-        model_data = {
-            'theta': self.theta.tolist(),
-            'config': {
-                'learning_rate': self.config.learning_rate,
-                'discount_factor': self.config.discount_factor
-            }
+    def save(self, filepath: str, format: Optional[str] = None):
+        """Save policy to file as 'npz' or 'json' (see QLearning.save)"""
+        if format is None:
+            format = 'json' if filepath.endswith('.json') else 'npz'
+        
+        config = {
+            'learning_rate': self.config.learning_rate,
+            'discount_factor': self.config.discount_factor
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(model_data, f, indent=2)
+        if format == 'npz':
+            filepath = _npz_path(filepath)
+            np.savez_compressed(filepath, theta=self.theta, config=np.array(json.dumps(config)))
+        elif format == 'json':
+            model_data = {
+                'theta': self.theta,
+                'config': config
+            }
+            
+            _dump_json(filepath, model_data)
+        else:
+            raise ValueError(f"Unknown save format: {format}")
         
         logger.info(f"Policy saved to {filepath}")
     
-    def load(self, filepath: str):
-        """Load policy from file"""
-        with open(filepath, 'r') as f:
-            model_data = json.load(f)
-        
-        self.theta = np.array(model_data['theta'])
+    def load(self, filepath: str, format: Optional[str] = None):
+        """Load policy from a file written by save"""
+        if format is None:
+            format = 'json' if filepath.endswith('.json') else 'npz'
+        
+        if format == 'npz':
+            filepath = _npz_path(filepath)
+            with np.load(filepath) as data:
+                self.theta = data['theta']
+                config_data = json.loads(str(data['config']))
+        elif format == 'json':
+            with open(filepath, 'r') as f:
+                model_data = json.load(f)
+            self.theta = np.array(model_data['theta'])
+            config_data = model_data['config']
+        else:
+            raise ValueError(f"Unknown save format: {format}")
         
         # Update config
-        config_data = model_data['config']
         self.config.learning_rate = config_data['learning_rate']
         self.config.discount_factor = config_data['discount_factor']
         
@@ -291,7 +435,7 @@ class ReinforcementLearning:
     """
     
     def __init__(self, algorithm: str = 'q_learning', state_size: int = 6, 
-                 action_size: int = 3, config: RLConfig = None):
+                 action_size: int = 3, config: RLConfig = None, seed: Optional[int] = None):
         """
         Initialize reinforcement learning agent
         
@@ -300,6 +444,8 @@ class ReinforcementLearning:
             state_size: Size of state space
             action_size: Size of action space
             config: RL configuration
+            seed: Seed for the agent's random generator, which also draws
+                the episode start states
         """
         if config is None:
             config = RLConfig()
@@ -308,47 +454,63 @@ class ReinforcementLearning:
         self.config = config
         
         if algorithm == 'q_learning':
-            self.agent = QLearning(state_size, action_size, config)
+            self.agent = QLearning(state_size, action_size, config, seed)
         elif algorithm == 'policy_gradient':
-            self.agent = PolicyGradient(state_size, action_size, config)
+            self.agent = PolicyGradient(state_size, action_size, config, seed)
         else:
             raise ValueError(f"Unknown algorithm: {algorithm}")
+        self.rng = self.agent.rng
         
         logger.info(f"Reinforcement Learning initialized with {algorithm}")
     
-    def train(self, simulation_function, episodes: int = 1000) -> Dict[str, List[float]]:
+    def train(self, simulation_function, episodes: int = 1000,
+              num_envs: int = 1) -> Dict[str, np.ndarray]:
         """
         Train the RL agent
         
         Args:
             simulation_function: Function that runs simulation and returns results
             episodes: Number of training episodes
+            num_envs: Number of episodes stepped side by side. Above 1, the
+                simulation function receives (n, state_size) states and (n,)
+                actions for the still-running environments and must return
+                'reward', 'next_state' and 'done' stacked along the first axis
             
         Returns:
-            Training history
+            Training history as per-episode arrays
         """
         history = {
-            'episode_rewards': [],
-            'episode_lengths': [],
-            'epsilon': [] if self.algorithm == 'q_learning' else []
+            'episode_rewards': np.empty(episodes, dtype=np.float32),
+            'episode_lengths': np.empty(episodes, dtype=np.int32),
+            'epsilon': np.empty(episodes if self.algorithm == 'q_learning' else 0,
+                                dtype=np.float32)
         }
+        rewards = history['episode_rewards']
         
         logger.info(f"Starting RL training for {episodes} episodes...")
         
-        for episode in range(episodes):
-            # Run episode
-            episode_reward, episode_length = self._run_episode(simulation_function)
+        episode = 0
+        while episode < episodes:
+            # Run episode(s)
+            if num_envs > 1:
+                episode_rewards, episode_lengths = self._run_batched_episodes(
+                    simulation_function, min(num_envs, episodes - episode))
+            else:
+                episode_reward, episode_length = self._run_episode(simulation_function)
+                episode_rewards, episode_lengths = [episode_reward], [episode_length]
             
-            # Update history
-            history['episode_rewards'].append(episode_reward)
-            history['episode_lengths'].append(episode_length)
-            
-            if self.algorithm == 'q_learning':
-                history['epsilon'].append(self.agent.config.epsilon)
-            
-            if episode % 100 == 0:
-                avg_reward = np.mean(history['episode_rewards'][-100:])
-                logger.info(f"Episode {episode}: Average Reward = {avg_reward:.2f}")
+            for episode_reward, episode_length in zip(episode_rewards, episode_lengths):
+                # Update history
+                rewards[episode] = episode_reward
+                history['episode_lengths'][episode] = episode_length
+                
+                if self.algorithm == 'q_learning':
+                    history['epsilon'][episode] = self.agent.epsilon
+                
+                if episode % 100 == 0:
+                    avg_reward = rewards[max(0, episode - 99):episode + 1].mean()
+                    logger.info(f"Episode {episode}: Average Reward = {avg_reward:.2f}")
+                episode += 1
         
         logger.info("RL training completed!")
         return history
@@ -362,10 +524,18 @@ class ReinforcementLearning:
         episode_length = 0
         
         # Simulate episode
-        state = np.random.randn(self.agent.state_size)
+        state = self.rng.standard_normal(self.agent.state_size)
+        q_learning = self.algorithm == 'q_learning'
+        
+        # Discretize each state once per step for Q-learning
+        if q_learning:
+            state_idx = self.agent.get_state_index(state)
         
         for step in range(100):  # Max episode length
-            action = self.agent.choose_action(state, training=True)
+            if q_learning:
+                action = self.agent.choose_action_index(state_idx, training=True)
+            else:
+                action = self.agent.choose_action(state)
             
             # Run simulation step
             results = simulation_function(state, action)
@@ -374,8 +544,10 @@ class ReinforcementLearning:
             done = results.get('done', False)
             
             # Store experience
-            if self.algorithm == 'q_learning':
-                self.agent.update_q_table(state, action, reward, next_state, done)
+            if q_learning:
+                next_state_idx = self.agent.get_state_index(next_state)
+                self.agent.update_q_index(state_idx, action, reward, next_state_idx, done)
+                state_idx = next_state_idx
             elif self.algorithm == 'policy_gradient':
                 self.agent.store_experience(state, action, reward)
             
@@ -393,6 +565,67 @@ class ReinforcementLearning:
         
         return episode_reward, episode_length
     
+    def _run_batched_episodes(self, simulation_function, num_envs: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Run num_envs episodes in lockstep, dropping environments as they finish"""
+        state_size = self.agent.state_size
+        q_learning = self.algorithm == 'q_learning'
+        
+        episode_rewards = np.zeros(num_envs)
+        episode_lengths = np.zeros(num_envs, dtype=np.int64)
+        
+        # Simulate episodes; active holds the env ids still running
+        states = self.rng.standard_normal((num_envs, state_size))
+        active = np.arange(num_envs)
+        
+        if q_learning:
+            state_idx = _hash_states(states, state_size)
+        else:
+            trajectory = []
+        
+        for step in range(100):  # Max episode length
+            if q_learning:
+                actions = self.agent.choose_actions_index(state_idx, training=True)
+            else:
+                actions = self.agent.choose_actions(states)
+            
+            # Run simulation step for every active environment
+            n = len(active)
+            results = simulation_function(states, actions)
+            rewards = np.broadcast_to(np.asarray(results.get('reward', 0), dtype=np.float64), (n,))
+            next_states = np.asarray(results.get('next_state', states), dtype=np.float64)
+            dones = np.broadcast_to(np.asarray(results.get('done', False), dtype=bool), (n,))
+            
+            # Store experience
+            if q_learning:
+                next_state_idx = _hash_states(next_states, state_size)
+                self.agent.update_q_batch(state_idx, actions, rewards, next_state_idx, dones)
+            else:
+                trajectory.append((active, states, actions, rewards))
+            
+            episode_rewards[active] += rewards
+            episode_lengths[active] += 1
+            
+            running = ~dones
+            active = active[running]
+            if not len(active):
+                break
+            
+            states = next_states[running]
+            if q_learning:
+                state_idx = next_state_idx[running]
+        
+        # Update policy once per finished episode for policy gradient
+        if not q_learning:
+            envs, states, actions, rewards = (np.concatenate(column) for column in zip(*trajectory))
+            for env in range(num_envs):
+                mask = envs == env
+                self.agent.episode_states.extend(states[mask])
+                self.agent.episode_actions.extend(actions[mask])
+                self.agent.episode_rewards.extend(rewards[mask])
+                self.agent.update_policy()
+        
+        return episode_rewards, episode_lengths
+    
     def get_strategy(self, state: np.ndarray) -> Dict[str, float]:
         """Get strategy from current policy"""
         if self.algorithm == 'q_learning':
@@ -413,10 +646,10 @@ class ReinforcementLearning:
         
         return strategy
     
-    def save(self, filepath: str):
+    def save(self, filepath: str, format: Optional[str] = None):
         """Save trained model"""
-        self.agent.save(filepath)
+        self.agent.save(filepath, format)
     
-    def load(self, filepath: str):
+    def load(self, filepath: str, format: Optional[str] = None):
         """Load trained model"""
-        self.agent.load(filepath)
+        self.agent.load(filepath, format)
@@ -9,24 +9,53 @@ import sys
 import os
 import argparse
 import logging
+import random
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from ai_training.models.genetic_algorithm import GeneticAlgorithm, Strategy
-from ai_training.models.neural_network import NeuralNetwork, NetworkConfig
-from ai_training.models.reinforcement_learning import ReinforcementLearning, RLConfig
+# Models are imported inside their trainers, and the ai_training packages
+# load model modules on first use, so a run (and each spawned GA worker)
+# only imports the backends of the models it trains
+if TYPE_CHECKING:
+    from ai_training.models.genetic_algorithm import Strategy
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
-def simulate_battle(strategy: Strategy) -> dict:
+# Random generator and result ranges shared by the battle simulators; result
+# columns follow RESULT_NAMES (survival_time, conversions, damage_dealt, damage_taken)
+_RNG = np.random.default_rng()
+_RESULT_LOW = np.array([50, 0, 20, 10], dtype=np.float32)
+_RESULT_HIGH = np.array([200, 10, 100, 80], dtype=np.float32)
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _sim_pop(params, out):
+        """Fill out with one simulated battle per parameter row, across threads"""
+        for i in prange(params.shape[0]):
+            aggression = params[i, 0]
+            patience = params[i, 1]
+            avoidance = params[i, 5]
+            out[i, 0] = (50 + 150 * np.random.random()) * patience
+            out[i, 1] = 10 * np.random.random() * aggression
+            out[i, 2] = (20 + 80 * np.random.random()) * aggression
+            out[i, 3] = (10 + 70 * np.random.random()) * (1 - avoidance)
+
+def simulate_battle(strategy: 'Strategy') -> dict:
     """
     Simulate a battle with the given strategy
     
@@ -39,8 +68,6 @@ def simulate_battle(strategy: Strategy) -> dict:
     Returns:
         Simulation results
     """
-    import random
-    
     # Simulate battle results based on strategy parameters
     survival_time = random.uniform(50, 200) * strategy.patience
     conversions = random.uniform(0, 10) * strategy.aggression
@@ -54,21 +81,101 @@ def simulate_battle(strategy: Strategy) -> dict:
         'damage_taken': damage_taken
     }
 
-def train_genetic_algorithm(population_size: int = 50, generations: int = 100):
-    """Train using genetic algorithm"""
+def simulate_battles(params: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    Simulate one battle for each row of strategy parameters
+    
+    Batched counterpart of simulate_battle, evaluating a whole population
+    in a parallel numba kernel, or with a single random draw without numba.
+    
+    Args:
+        params: Strategy genes (n, 6) ordered as aggression, patience,
+            grouping, speed, vision, avoidance
+        out: Optional float32 (n, 4) array to write the results into
+        
+    Returns:
+        Simulation results (n, 4) with columns survival_time, conversions,
+        damage_dealt, damage_taken
+    """
+    if NUMBA_AVAILABLE:
+        if out is None:
+            out = np.empty((len(params), 4), dtype=np.float32)
+        _sim_pop(params, out)
+        return out
+    
+    results = _RNG.random((len(params), 4), dtype=np.float32, out=out)
+    results *= _RESULT_HIGH - _RESULT_LOW
+    results += _RESULT_LOW
+    
+    # Scale by the strategy parameters that drive each result
+    results[:, 0] *= params[:, 1]
+    results[:, 1] *= params[:, 0]
+    results[:, 2] *= params[:, 0]
+    results[:, 3] *= 1 - params[:, 5]
+    
+    return results
+
+def simulate_rl_steps(states: np.ndarray, actions: np.ndarray) -> dict:
+    """
+    Advance a batch of RL environments by one step
+    
+    Each action sets the aggression/patience balance (as in
+    ReinforcementLearning.get_strategy), the state supplies the remaining
+    parameters, and the reward is derived from one simulated battle per env.
+    
+    Args:
+        states: Current states (n, 6)
+        actions: Chosen action per environment (n,)
+        
+    Returns:
+        Stacked 'reward', 'next_state' and 'done' arrays
+    """
+    n = len(actions)
+    params = np.clip(states, 0, 1).astype(np.float32)
+    params[:, 0] = actions / 3
+    params[:, 1] = 1 - params[:, 0]
+    
+    survival_time, conversions, damage_dealt, damage_taken = simulate_battles(params).T
+    reward = (survival_time * 0.3 + conversions * 10.0
+              + damage_dealt / np.maximum(damage_taken, 1) * 5.0) / 100
+    
+    return {
+        'reward': reward,
+        'next_state': _RNG.standard_normal((n, states.shape[1])),
+        'done': _RNG.random(n) < 0.05
+    }
+
+def train_genetic_algorithm(population_size: int = 50, generations: int = 100,
+                            n_workers: int = 1, pool: Optional[Executor] = None):
+    """
+    Train using genetic algorithm
+    
+    With n_workers above 1 (or 0 for one per CPU), strategies are simulated one
+    by one across a process pool, reusing pool when one is passed in; otherwise
+    the batched simulator is used.
+    """
+    from ai_training.models.genetic_algorithm import GeneticAlgorithm
+    
     logger.info("Starting Genetic Algorithm training...")
     
     # Initialize genetic algorithm
     ga = GeneticAlgorithm(
         population_size=population_size,
-        max_generations=generations
+        max_generations=generations,
+        n_workers=n_workers or None
     )
     
     # Train
-    best_strategy = ga.evolve(simulate_battle)
+    if ga.n_workers > 1:
+        best_strategy = ga.evolve(simulate_battle, executor=pool)
+    else:
+        # Reuse one results buffer; the GA copies results out of it
+        results = np.empty((population_size, 4), dtype=np.float32)
+        best_strategy = ga.evolve(
+            batch_simulation_function=lambda genes: simulate_battles(genes, out=results[:len(genes)]))
     
     # Save results
-    ga.save_population('ai_training/data/strategy-evaluations/ga_population.json')
+    ga.save_population('ai_training/data/strategy-evaluations/ga_population.npz')
     
     logger.info(f"Genetic Algorithm training completed!")
     logger.info(f"Best strategy: {best_strategy}")
@@ -77,22 +184,23 @@ def train_genetic_algorithm(population_size: int = 50, generations: int = 100):
 
 def train_neural_network(epochs: int = 100):
     """Train using neural network"""
-    logger.info("Starting Neural Network training...")
+    from ai_training.models.neural_network import NeuralNetwork, NetworkConfig, JAX_AVAILABLE
     
-    # Generate training data
-    import numpy as np
+    logger.info("Starting Neural Network training...")
     
-    # Create synthetic training data
+    # Create synthetic training data, in the network's float32 precision
     n_samples = 1000
-    X = np.random.rand(n_samples, 6)  # 6 input features
-    y = np.random.rand(n_samples, 3)  # 3 output targets
+    rng = np.random.default_rng(0)
+    X = rng.random((n_samples, 6), dtype=np.float32)  # 6 input features
+    y = rng.random((n_samples, 3), dtype=np.float32)  # 3 output targets
     
-    # Initialize neural network
+    # Initialize neural network, training with jitted JAX steps when available
     config = NetworkConfig(
         input_size=6,
         hidden_sizes=[64, 32],
         output_size=3,
-        learning_rate=0.001
+        learning_rate=0.001,
+        backend='jax' if JAX_AVAILABLE else 'numpy'
     )
     
     nn = NeuralNetwork(config)
@@ -108,8 +216,10 @@ def train_neural_network(epochs: int = 100):
     
     return nn
 
-def train_reinforcement_learning(episodes: int = 1000):
-    """Train using reinforcement learning"""
+def train_reinforcement_learning(episodes: int = 1000, num_envs: int = 32):
+    """Train using reinforcement learning, stepping num_envs episodes at a time"""
+    from ai_training.models.reinforcement_learning import ReinforcementLearning, RLConfig
+    
     logger.info("Starting Reinforcement Learning training...")
     
     # Initialize RL agent
@@ -127,7 +237,7 @@ def train_reinforcement_learning(episodes: int = 1000):
     )
     
     # Train
-    history = rl.train(simulate_battle, episodes=episodes)
+    history = rl.train(simulate_rl_steps, episodes=episodes, num_envs=num_envs)
     
     # Save model
     rl.save('ai_training/data/strategy-evaluations/reinforcement_learning.json')
@@ -139,6 +249,12 @@ def train_reinforcement_learning(episodes: int = 1000):
 
 def main():
     """Main training function"""
+    # Setup logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    
     parser = argparse.ArgumentParser(description='Train AI models for Rock Paper Scissors')
     parser.add_argument('--model', choices=['genetic', 'neural', 'rl', 'all'], 
                        default='all', help='Model to train')
@@ -146,6 +262,8 @@ def main():
                        help='Population size for genetic algorithm')
     parser.add_argument('--generations', type=int, default=100,
                        help='Number of generations for genetic algorithm')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Worker processes for genetic algorithm fitness (0 = one per CPU)')
     parser.add_argument('--epochs', type=int, default=100,
                        help='Number of epochs for neural network')
     parser.add_argument('--episodes', type=int, default=1000,
@@ -159,14 +277,24 @@ def main():
     logger.info("🎮 Rock Paper Scissors Battle Royale - AI Training")
     logger.info("=" * 60)
     
-    if args.model in ['genetic', 'all']:
-        train_genetic_algorithm(args.population_size, args.generations)
-    
-    if args.model in ['neural', 'all']:
-        train_neural_network(args.epochs)
+    # Start the GA's worker processes once, only when the GA is trained;
+    # numba's thread pool does not survive a fork, so spawn them when it is used
+    n_workers = args.workers or os.cpu_count() or 1
+    pool = None
+    if n_workers > 1 and args.model in ('genetic', 'all'):
+        context = multiprocessing.get_context('spawn') if NUMBA_AVAILABLE else None
+        pool = ProcessPoolExecutor(max_workers=n_workers, mp_context=context)
     
-    if args.model in ['rl', 'all']:
-        train_reinforcement_learning(args.episodes)
+    with pool or nullcontext():
+        if args.model in ['genetic', 'all']:
+            train_genetic_algorithm(args.population_size, args.generations, args.workers,
+                                    pool=pool)
+        
+        if args.model in ['neural', 'all']:
+            train_neural_network(args.epochs)
+        
+        if args.model in ['rl', 'all']:
+            train_reinforcement_learning(args.episodes)
     
     logger.info("🎉 All training completed!")
     logger.info("📁 Results saved to ai_training/data/strategy-evaluations/")
@@ -3,7 +3,7 @@
 Setup script for Rock Paper Scissors Battle Royale AI Training Platform
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 import os
 
 # Read the README file
@@ -23,7 +23,12 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/rock-paper-scissors",
-    packages=find_packages(),
+    # Keep in sync with the package directories on disk
+    packages=[
+        "ai_training",
+        "ai_training.models",
+        "ai_training.scripts",
+    ],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -68,7 +73,6 @@ setup(
             "rps-server=src.api.server:main",
         ],
     },
-    include_package_data=True,
     package_data={
         "": ["*.json", "*.yaml", "*.yml", "*.txt", "*.md"],
     },